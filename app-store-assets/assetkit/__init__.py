@@ -0,0 +1,9 @@
+"""
+앱스토어 에셋 생성 스크립트들이 함께 쓰는 공용 모듈
+"""
+
+import os
+
+# app-store-assets 폴더와 캐시 폴더 경로
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ASSETS_DIR, ".build-cache")
@@ -0,0 +1,450 @@
+"""
+app-store-assets 렌더링 벤치마크
+
+실제 기기 해상도의 합성 스크린샷을 만들어 스크린샷 프레임(add_text_to_image),
+Feature Graphic, 대표 색상 추출, 2단계 축소(resize 품질별 시간과 전체 LANCZOS 대비 PSNR)를
+단계별로 따로 잰다. tiled:<기기> 케이스는 같은 스크린샷을 띠 단위 렌더링(tiled)으로 저장해서
+frame:<기기> 와 최대 RSS 를 비교한다 (4-8K 캔버스는 --devices tablet_4k print_8k 로 직접 선택).
+regress:<기기> 케이스는 캡션을 1px 내린 결과를 regress.compare 로 재고, 변경 픽셀을 빠짐없이
+세는지 함께 확인한다.
+  - 단계별 wall time (반복 측정의 중앙값/최솟값, ms)
+  - 케이스별 최대 RSS (케이스마다 새 프로세스에서 측정)
+  - 결과 JSON 저장 및 기준(baseline) JSON 과 비교
+
+네트워크와 macOS 폰트 없이도 돌아간다 (폰트가 없으면 기본 폰트로 측정하고
+결과 meta.font 에 기록한다).
+"""
+
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+import PIL
+from PIL import Image
+
+from . import colors, feature_graphic, fonts, frame, glyphs, regress, resize, screenshot, tiled
+
+# 측정할 기기 해상도 (스토어 제출 규격 + 실제 캡처 크기)
+DEVICES = {
+    "android_fhd": (1080, 2400),       # 일반 안드로이드 FHD+
+    "android_qhd": (1440, 3200),       # QHD+ 캡처
+    "iphone_6_7": (1290, 2796),        # App Store 6.7"
+    "iphone_6_5": (1242, 2688),        # App Store 6.5"
+    "iphone_5_5": (1242, 2208),        # App Store 5.5"
+}
+
+# 기본 측정에서는 빼는 큰 캔버스 (--devices 로 선택)
+LARGE_DEVICES = {
+    "tablet_4k": (2160, 3840),         # 태블릿 4K
+    "print_8k": (4320, 7680),          # 인쇄/포스터용 8K
+}
+
+SAMPLE_TITLE = "여행지 맛집을 한눈에 발견하세요"
+SAMPLE_SUBTITLE = "구글 평점과 유튜브 추천 맛집을 모두 확인할 수 있어요"
+
+# 기준 대비 이 배율보다 느려지면 회귀로 표시
+DEFAULT_THRESHOLD = 1.25
+
+
+class StageTimer:
+    """with timer.stage("이름"): ... 형태로 단계별 시간 누적"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[name].append(time.perf_counter() - started)
+
+    def summary(self):
+        return {name: {"median_ms": round(statistics.median(values) * 1000, 3),
+                       "min_ms": round(min(values) * 1000, 3)}
+                for name, values in self.samples.items()}
+
+
+# ---- 합성 입력 ----
+
+def synthetic_screenshot(width, height, seed=0):
+    """앱 화면처럼 보이는 결정적 합성 이미지 (그라데이션 + 카드 + 사진 노이즈)"""
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    x = np.linspace(0, 1, width, dtype=np.float32)[None, :]
+    pixels = np.empty((height, width, 3), dtype=np.float32)
+    pixels[..., 0] = 245 - 30 * y + 0 * x
+    pixels[..., 1] = 240 - 20 * x
+    pixels[..., 2] = 235 - 25 * y * x
+
+    # 리스트 카드 (단색 영역) 와 썸네일 (사진 같은 노이즈)
+    card_height = height // 8
+    for i in range(1, 7):
+        top = i * card_height + 20
+        pixels[top:top + card_height - 40, 40:width - 40] = rng.integers(200, 256, 3)
+        thumb = rng.normal(128, 50, (card_height - 60, card_height - 60, 3))
+        pixels[top + 10:top + card_height - 50, 60:60 + card_height - 60] = thumb
+
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), 'RGB')
+
+
+def synthetic_icon(size=1024, seed=0):
+    """배경색 + 원형 심볼 + 반투명 가장자리를 가진 RGBA 아이콘"""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:size, 0:size]
+    radius = np.hypot(xx - size / 2, yy - size / 2)
+    pixels = np.zeros((size, size, 4), dtype=np.uint8)
+    pixels[...] = (196, 154, 96, 255)
+    pixels[radius < size * 0.3] = (248, 247, 247, 255)
+    pixels[radius > size * 0.48, 3] = 0
+    noise = rng.integers(-3, 4, (size, size, 3))
+    pixels[..., :3] = np.clip(pixels[..., :3].astype(int) + noise, 0, 255)
+    return Image.fromarray(pixels, 'RGBA')
+
+
+def _write_jpeg(img, directory, name):
+    path = os.path.join(directory, f"{name}.jpeg")
+    img.save(path, 'JPEG', quality=92)
+    return path
+
+
+# ---- 케이스 ----
+
+def bench_frame(path, repeat):
+    """add_text_to_image 를 단계별로 분해해서 측정"""
+    timer = StageTimer()
+    output = io.BytesIO()
+    for _ in range(repeat):
+        frame.frame_template.cache_clear()
+        glyphs.clear()
+        with timer.stage("total"):
+            with timer.stage("decode"):
+                with Image.open(path) as img:
+                    img.load()
+            with timer.stage("frame_template"):
+                template = frame.frame_template(img.width, img.height)
+            with timer.stage("resize"):
+                _, _, screen_width, screen_height = template.screen_box
+                screen_img = resize.resize(img, (screen_width, screen_height))
+            with timer.stage("paste"):
+                canvas = template.canvas.copy()
+                canvas.paste(screen_img, template.screen_box[:2], template.screen_mask)
+            with timer.stage("caption"):
+                screenshot.draw_caption(canvas, SAMPLE_TITLE, SAMPLE_SUBTITLE)
+            with timer.stage("encode"):
+                output.seek(0)
+                output.truncate()
+                canvas.save(output, 'JPEG', quality=95)
+        # 템플릿 캐시가 이미 있을 때 (같은 기기 크기 2번째 파일부터)
+        with timer.stage("frame_template_warm"):
+            frame.frame_template(img.width, img.height)
+        # 같은 캡션의 글자 마스크가 이미 있을 때 (다른 기기 크기, 두 번째 실행부터)
+        with timer.stage("caption_warm"):
+            screenshot.draw_caption(canvas, SAMPLE_TITLE, SAMPLE_SUBTITLE)
+    return timer, {"input_size": list(img.size), "output_size": list(canvas.size),
+                   "output_bytes": output.tell()}
+
+
+def bench_tiled(path, repeat):
+    """띠 단위 렌더링 + 스트리밍 저장 (frame 케이스와 같은 입력)"""
+    timer = StageTimer()
+    output = os.path.splitext(path)[0] + "_tiled.png"
+    for _ in range(repeat):
+        # bench_frame 과 같이 매번 글자 마스크부터 (디스크 캐시도 쓰지 않음)
+        glyphs.clear()
+        with timer.stage("total"):
+            with timer.stage("decode"):
+                with Image.open(path) as img:
+                    img.load()
+            with timer.stage("render_encode"):
+                size = tiled.render_to_file(img, output, SAMPLE_TITLE, SAMPLE_SUBTITLE)
+    return timer, {"input_size": list(img.size),
+                   "output_size": list(tiled.canvas_size(img.size)), "output_bytes": size}
+
+
+def bench_regress(path, repeat):
+    """캡션을 1px 내린 결과를 골든과 비교 (regress.compare 시간 + 변경 픽셀을 빠짐없이 세는지)"""
+    timer = StageTimer()
+    with Image.open(path) as img:
+        img.load()
+    composed = screenshot.compose_frame(img)
+    golden_path = os.path.splitext(path)[0] + "_golden.png"
+    new_path = os.path.splitext(path)[0] + "_shifted.png"
+    screenshot.draw_caption(composed.copy(), SAMPLE_TITLE, SAMPLE_SUBTITLE).save(golden_path)
+    shifted = screenshot.DEFAULT_CAPTION._replace(text_top=screenshot.DEFAULT_CAPTION.text_top + 1)
+    screenshot.draw_caption(composed.copy(), SAMPLE_TITLE, SAMPLE_SUBTITLE, shifted).save(new_path)
+
+    report_dir = os.path.join(os.path.dirname(path), "regress")
+    for _ in range(repeat):
+        with timer.stage("compare"):
+            result = regress.compare("shifted", new_path, golden_path, report_dir)
+    with Image.open(new_path) as a, Image.open(golden_path) as b:
+        diff = np.abs(np.asarray(a.convert('RGB'), dtype=np.int16) - np.asarray(b.convert('RGB'), dtype=np.int16))
+    expected = int((diff.max(axis=2) > regress.DEFAULT_TOLERANCE).sum())
+    return timer, {"status": result.status, "changed_pixels": result.changed_pixels,
+                   "expected_changed_pixels": expected,
+                   "regress_ok": result.changed_pixels == expected}
+
+
+def bench_feature_graphic(repeat):
+    timer = StageTimer()
+    output = io.BytesIO()
+    for _ in range(repeat):
+        with timer.stage("render"):
+            img = feature_graphic.render_feature_graphic()
+        with timer.stage("encode"):
+            output.seek(0)
+            output.truncate()
+            img.save(output, 'PNG')
+    return timer, {"output_bytes": output.tell()}
+
+
+def bench_simple_feature_graphic(repeat):
+    timer = StageTimer()
+    icon = synthetic_icon()
+    output = io.BytesIO()
+    for _ in range(repeat):
+        with timer.stage("render"):
+            img = feature_graphic.render_simple_feature_graphic(icon)
+        with timer.stage("encode"):
+            output.seek(0)
+            output.truncate()
+            img.save(output, 'PNG')
+    return timer, {"output_bytes": output.tell()}
+
+
+def bench_colors(path, repeat):
+    timer = StageTimer()
+    with Image.open(path) as img:
+        img.load()
+    for _ in range(repeat):
+        with timer.stage("dominant_colors"):
+            top = colors.dominant_colors(img)
+        with timer.stage("dominant_colors_sampled"):
+            colors.dominant_colors(img, bits=5, max_pixels=250_000)
+        with timer.stage("kmeans_palette"):
+            colors.kmeans_palette(img)
+    return timer, {"top_color": list(top[0][0])}
+
+
+def _resize_targets(size):
+    """축소 케이스 목표 크기 {이름: (w, h)}"""
+    width, height = size
+    if width == height:
+        # 아이콘 → Feature Graphic 아이콘 크기
+        return {"icon": feature_graphic.icon_size(size)}
+    scale = min(540 / width, 1080 / height)
+    return {
+        "screen": frame.screen_box(width, height)[2:],           # 프레임 스크린 (거의 원본 크기)
+        "web": (round(width * scale), round(height * scale)),  # 랜딩 페이지 WebP
+        "quarter": (width // 4, height // 4),                  # 미리보기 1/4
+    }
+
+
+def bench_resize(path, repeat):
+    """품질별 2단계 축소 시간과 전체 LANCZOS(exact) 대비 PSNR"""
+    timer = StageTimer()
+    with Image.open(path) as img:
+        img.load()
+    psnr = {}
+    factors = {}
+    for target, size in _resize_targets(img.size).items():
+        exact = None
+        for quality in resize.QUALITY_GAPS:
+            name = f"{target}_{quality}"
+            for _ in range(repeat):
+                with timer.stage(name):
+                    result = resize.resize(img, size, quality=quality)
+            if exact is None:
+                exact = result
+            value = resize.psnr(exact, result)
+            psnr[name] = None if value == float("inf") else round(value, 2)  # None: exact 와 동일
+            factors[name] = list(resize.reduction_factor(img.size, size, quality))
+    worst = min((value for value in psnr.values() if value is not None), default=None)
+    return timer, {"input_size": list(img.size), "psnr_db": psnr, "reduce_factor": factors,
+                   "psnr_ok": bool(worst is None or worst >= resize.MIN_PSNR)}
+
+
+def _run_case(case):
+    """케이스 1개 실행 (격리 모드에서는 새 프로세스에서 호출됨)"""
+    name, kind, args, repeat = case
+    runner = {
+        "frame": bench_frame,
+        "feature_graphic": bench_feature_graphic,
+        "simple_feature_graphic": bench_simple_feature_graphic,
+        "colors": bench_colors,
+        "resize": bench_resize,
+        "tiled": bench_tiled,
+        "regress": bench_regress,
+    }[kind]
+    timer, info = runner(*args, repeat)
+    return name, {"stages": timer.summary(), "peak_rss_mb": peak_rss_mb(), **info}
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)
+
+    리눅스의 ru_maxrss 는 exec 후에도 부모 값이 남으므로 /proc 의 VmHWM 을 우선 사용한다.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # macOS 는 byte 단위
+        peak //= 1024
+    return round(peak / 1024, 1)
+
+
+def build_cases(workdir, devices=None, repeat=3, only=None):
+    """합성 입력을 workdir 에 만들고 케이스 목록 반환"""
+    cases = []
+    for device in devices or DEVICES:
+        width, height = {**DEVICES, **LARGE_DEVICES}[device]
+        path = _write_jpeg(synthetic_screenshot(width, height), workdir, device)
+        cases.append((f"frame:{device}", "frame", (path,), repeat))
+        cases.append((f"tiled:{device}", "tiled", (path,), repeat))
+        cases.append((f"regress:{device}", "regress", (path,), repeat))
+        cases.append((f"colors:{device}", "colors", (path,), repeat))
+        cases.append((f"resize:{device}", "resize", (path,), repeat))
+    icon_path = os.path.join(workdir, "icon.png")
+    synthetic_icon().save(icon_path)
+    cases.append(("colors:icon", "colors", (icon_path,), repeat))
+    large_icon_path = os.path.join(workdir, "icon_large.png")
+    synthetic_icon(4096).save(large_icon_path)
+    cases.append(("resize:icon", "resize", (large_icon_path,), repeat))
+    cases.append(("feature_graphic", "feature_graphic", (), repeat))
+    cases.append(("simple_feature_graphic", "simple_feature_graphic", (), repeat))
+    if only:
+        cases = [case for case in cases if any(case[0].startswith(prefix) for prefix in only)]
+    return cases
+
+
+def run_benchmarks(devices=None, repeat=3, only=None, isolate=True):
+    """벤치마크 실행 후 결과 dict 반환"""
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "font": (os.path.basename(fonts.KOREAN_FONT_PATH)
+                     if os.path.exists(fonts.KOREAN_FONT_PATH) else "default"),
+            "repeat": repeat,
+        },
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="assets-bench-") as workdir:
+        cases = build_cases(workdir, devices, repeat, only)
+        if isolate:
+            # 케이스별 최대 RSS 를 따로 재기 위해 케이스마다 새 프로세스 사용
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(1, maxtasksperchild=1) as pool:
+                outcomes = pool.map(_run_case, cases, chunksize=1)
+        else:
+            outcomes = [_run_case(case) for case in cases]
+    results["cases"] = dict(outcomes)
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """기준 대비 단계별 비율 목록 [(케이스, 단계, 기준 ms, 현재 ms, 비율, 회귀 여부)]"""
+    rows = []
+    for case, data in results["cases"].items():
+        base_case = baseline.get("cases", {}).get(case)
+        if not base_case:
+            continue
+        for stage, timing in data["stages"].items():
+            base = base_case["stages"].get(stage)
+            if not base or not base["median_ms"]:
+                continue
+            ratio = timing["median_ms"] / base["median_ms"]
+            rows.append((case, stage, base["median_ms"], timing["median_ms"], ratio, ratio > threshold))
+    return rows
+
+
+def print_results(results):
+    for case, data in results["cases"].items():
+        print(f"\n📊 {case}  (최대 RSS {data['peak_rss_mb']} MB)")
+        psnr = data.get("psnr_db", {})
+        for stage, timing in data["stages"].items():
+            line = f"   {stage:<24} {timing['median_ms']:>10.2f} ms  (min {timing['min_ms']:.2f})"
+            if stage in psnr:
+                value = psnr[stage]
+                mark = "⚠️ " if value is not None and value < resize.MIN_PSNR else ""
+                line += f"  {mark}PSNR {'동일' if value is None else f'{value:.1f} dB'}"
+            print(line)
+        if "regress_ok" in data:
+            mark = "✅" if data["regress_ok"] else "❌"
+            print(f"   {mark} 캡션 1px 이동: {data['status']} · 변경 픽셀 "
+                  f"{data['changed_pixels']}/{data['expected_changed_pixels']}")
+
+
+def print_comparison(rows, threshold):
+    print(f"\n📈 기준 대비 (회귀 기준 x{threshold:.2f})")
+    for case, stage, base, current, ratio, regressed in rows:
+        mark = "❌" if regressed else ("✅" if ratio < 1 / threshold else "  ")
+        print(f" {mark} {case:<28} {stage:<24} {base:>9.2f} → {current:>9.2f} ms  x{ratio:.2f}")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="app-store-assets 렌더링 벤치마크")
+    parser.add_argument("--devices", nargs="+", choices=sorted({**DEVICES, **LARGE_DEVICES}), default=None,
+                        help="측정할 기기 해상도 (기본값: 전부)")
+    parser.add_argument("--only", nargs="+", default=None, metavar="PREFIX",
+                        help="이름이 PREFIX 로 시작하는 케이스만 (예: frame colors:icon)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="케이스를 한 프로세스에서 실행 (빠르지만 RSS 는 누적값)")
+    parser.add_argument("--output", "-o", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="이 배율보다 느려지면 회귀로 판단")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.devices, args.repeat, args.only, not args.no_isolate)
+    print_results(results)
+
+    if args.output:
+        # 직렬화 중에 실패해도 기존 결과(기준 JSON)가 잘린 채 남지 않게 임시 파일에 쓰고 교체
+        tmp_path = f"{args.output}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, args.output)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        print_comparison(rows, args.threshold)
+        if args.fail_on_regression and any(row[-1] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
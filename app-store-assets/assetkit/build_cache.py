@@ -0,0 +1,129 @@
+"""
+생성된 에셋용 증분 빌드 캐시
+
+출력 파일마다 입력 이미지/폰트 바이트 해시, 캡션 텍스트, 레이아웃 파라미터를
+합쳐 키를 만들고 manifest(JSON)에 기록한다. 키가 같고 출력 파일이 그대로
+남아 있으면 다시 렌더링하지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from . import ASSETS_DIR, CACHE_DIR
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+
+def _stat_signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _relpath(path):
+    """manifest에는 app-store-assets 기준 상대 경로로 저장 (폴더 밖이면 절대 경로)"""
+    path = os.path.abspath(path)
+    rel = os.path.relpath(path, ASSETS_DIR)
+    return path if rel.startswith("..") else rel
+
+
+class BuildCache:
+    """manifest 기반 빌드 캐시 (적중/미적중/절약 시간 통계 포함)"""
+
+    def __init__(self, manifest_path=MANIFEST_PATH, force=False):
+        self.manifest_path = manifest_path
+        self.force = force
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self._started = time.perf_counter()
+        self._files = {}
+        self._outputs = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self._files = data.get("files", {})
+        self._outputs = data.get("outputs", {})
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "files": self._files,
+                "outputs": self._outputs,
+            }, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def file_digest(self, path):
+        """파일 SHA-256 (크기·mtime이 같으면 manifest에 저장된 값 재사용, 없으면 None)"""
+        try:
+            size, mtime_ns = _stat_signature(path)
+        except OSError:
+            return None
+        rel = _relpath(path)
+        entry = self._files.get(rel)
+        if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+            return entry["sha256"]
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self._files[rel] = {"size": size, "mtime_ns": mtime_ns, "sha256": digest}
+        return digest
+
+    def key(self, files=(), **parts):
+        """입력 파일 해시 + 텍스트/레이아웃 파라미터로 출력 캐시 키 생성
+
+        parts 값은 JSON으로 직렬화할 수 있어야 한다 (튜플은 리스트로 취급).
+        """
+        payload = {
+            "files": {_relpath(p): self.file_digest(p) for p in files},
+            "parts": parts,
+        }
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=list)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, output_path, key):
+        """캐시 적중 여부 확인 (적중이면 통계에 반영)"""
+        entry = self._outputs.get(_relpath(output_path))
+        fresh = False
+        if not self.force and entry and entry["key"] == key:
+            try:
+                fresh = _stat_signature(output_path) == (entry["size"], entry["mtime_ns"])
+            except OSError:
+                fresh = False
+
+        if fresh:
+            self.hits += 1
+            self.saved_seconds += entry.get("seconds", 0.0)
+        else:
+            self.misses += 1
+        return fresh
+
+    def record(self, output_path, key, seconds):
+        """새로 렌더링한 출력 기록 (다음 실행 때 적중 판단용)"""
+        size, mtime_ns = _stat_signature(output_path)
+        self._outputs[_relpath(output_path)] = {
+            "key": key,
+            "seconds": round(seconds, 4),
+            "size": size,
+            "mtime_ns": mtime_ns,
+        }
+
+    def summary(self):
+        elapsed = time.perf_counter() - self._started
+        return (f"📦 빌드 캐시: 적중 {self.hits} · 미적중 {self.misses} · "
+                f"절약 약 {self.saved_seconds:.2f}초 (총 소요 {elapsed:.2f}초)")
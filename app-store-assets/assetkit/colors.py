@@ -0,0 +1,112 @@
+"""
+NumPy 기반 대표 색상 / 팔레트 추출
+
+픽셀마다 파이썬 튜플을 만드는 Counter 방식 대신 RGBA 바이트를 uint32 키로
+그대로 보고(view) np.unique 로 한 번에 센다.
+  - bits: 채널별 상위 비트만 남겨 비슷한 색을 묶음 (8이면 원본 그대로)
+  - max_pixels: 픽셀이 많으면 격자 간격으로 샘플링 (색 값은 섞지 않음)
+  - min_alpha: 알파가 이 값보다 작은 픽셀은 제외 (None이면 알파 무시)
+"""
+
+import math
+
+import numpy as np
+from PIL import Image
+
+RGB_MASK = 0x00FFFFFF
+
+
+def _as_rgba(image):
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    return image
+
+
+def pixel_keys(image, bits=8, max_pixels=None, min_alpha=None):
+    """이미지 픽셀을 R | G << 8 | B << 16 형태의 uint32 키 배열로 변환"""
+    rgba = np.asarray(_as_rgba(image))
+    height, width = rgba.shape[:2]
+
+    # 너무 크면 격자 간격 샘플링 (stride view라 복사 없음)
+    if max_pixels and width * height > max_pixels:
+        step = math.ceil(math.sqrt(width * height / max_pixels))
+        rgba = rgba[::step, ::step]
+
+    # (h, w, 4) uint8 -> (h, w) uint32 (연속 메모리면 복사 없는 view)
+    packed = np.ascontiguousarray(rgba).view('<u4').reshape(-1)
+
+    if min_alpha is not None:
+        packed = packed[(packed >> 24) >= min_alpha]
+
+    mask = RGB_MASK
+    if bits < 8:
+        channel = (0xFF << (8 - bits)) & 0xFF
+        mask = channel | channel << 8 | channel << 16
+    return packed & np.uint32(mask)
+
+
+def unpack_key(key):
+    key = int(key)
+    return key & 0xFF, (key >> 8) & 0xFF, (key >> 16) & 0xFF
+
+
+def color_counts(image, bits=8, max_pixels=None, min_alpha=None):
+    """(키 배열, 개수 배열) 을 많이 쓰인 순서로 반환
+
+    개수가 같으면 이미지에서 먼저 나온 색이 앞에 온다 (Counter.most_common 과 동일).
+    """
+    keys = pixel_keys(image, bits, max_pixels, min_alpha)
+    if keys.size == 0:
+        return keys, np.zeros(0, dtype=np.int64)
+    unique, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.lexsort((first_index, -counts))
+    return unique[order], counts[order]
+
+
+def dominant_colors(image, top=5, bits=8, max_pixels=None, min_alpha=None):
+    """가장 많이 쓰인 색 top개를 [((r, g, b), 픽셀 수), ...] 로 반환"""
+    keys, counts = color_counts(image, bits, max_pixels, min_alpha)
+    return [(unpack_key(k), int(c)) for k, c in zip(keys[:top], counts[:top])]
+
+
+def kmeans_palette(image, k=5, iterations=12, bits=5, max_pixels=250_000, min_alpha=None):
+    """k-means 방식 팔레트 추출 [((r, g, b), 비율), ...] (비율 큰 순)
+
+    양자화된 고유 색을 픽셀 수로 가중해서 군집화하므로 픽셀 수와 무관하게 빠르다.
+    초기 중심은 가장 많이 쓰인 색 k개라서 결과가 항상 같다.
+    """
+    keys, counts = color_counts(image, bits, max_pixels, min_alpha)
+    if keys.size == 0:
+        return []
+
+    colors = np.stack([keys & 0xFF, (keys >> 8) & 0xFF, (keys >> 16) & 0xFF], axis=1).astype(np.float64)
+    weights = counts.astype(np.float64)
+    k = min(k, len(colors))
+    centers = colors[:k].copy()
+
+    for _ in range(iterations):
+        distances = ((colors[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        cluster_weights = np.bincount(labels, weights=weights, minlength=k)
+        new_centers = centers.copy()
+        for channel in range(3):
+            sums = np.bincount(labels, weights=weights * colors[:, channel], minlength=k)
+            filled = cluster_weights > 0
+            new_centers[filled, channel] = sums[filled] / cluster_weights[filled]
+        if np.allclose(new_centers, centers):
+            break
+        centers = new_centers
+
+    distances = ((colors[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    labels = distances.argmin(axis=1)
+    shares = np.bincount(labels, weights=weights, minlength=k) / weights.sum()
+    order = np.argsort(-shares, kind='stable')
+    return [(tuple(int(round(v)) for v in centers[i]), float(shares[i]))
+            for i in order if shares[i] > 0]
+
+
+def open_image(path):
+    """색상 분석용으로 이미지 열기 (파일 핸들은 바로 닫음)"""
+    with Image.open(path) as image:
+        image.load()
+        return image
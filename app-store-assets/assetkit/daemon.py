@@ -0,0 +1,201 @@
+"""
+렌더 데몬 (assets.py daemon)
+
+assets.py 명령을 유닉스 소켓(.build-cache/assets.sock)으로 받아 계속 살아 있는 프로세스에서
+실행한다. 인터프리터 시작, Pillow/NumPy import, 폰트 로드, 프레임 템플릿 LRU, 팔레트 캐시가
+첫 요청 뒤로 데워진 채 남으므로 반복 실행이 수 ms 로 끝난다.
+
+  - 요청: {"argv": [...], "cwd": "..."} 한 줄 (JSON)
+  - 응답: 출력 조각 {"out": "..."} 여러 줄, 마지막에 {"exit": 종료 코드}
+  - 요청은 한 번에 하나씩 처리한다 (stdout/cwd 를 바꿔 가며 실행하므로)
+  - assetkit 이나 스크립트 코드가 바뀌면 {"stale": true} 로 돌려보낸 뒤 새 코드로 재시작한다
+    (클라이언트는 그 요청을 직접 실행)
+
+이 모듈은 표준 라이브러리만 import 한다 (클라이언트 쪽이 가볍도록).
+"""
+
+import contextlib
+import glob
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+
+from . import ASSETS_DIR, CACHE_DIR
+
+SOCKET_PATH = os.path.join(CACHE_DIR, "assets.sock")
+
+# 바뀌면 데몬을 재시작하는 코드 파일
+_CODE_PATTERNS = ("*.py", "assetkit/*.py", "screenshots/*.py")
+
+
+def _code_state():
+    state = {}
+    for pattern in _CODE_PATTERNS:
+        for path in glob.glob(os.path.join(ASSETS_DIR, pattern)):
+            try:
+                state[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+    return state
+
+
+def _send(wfile, **message):
+    wfile.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+    wfile.flush()
+
+
+class _Output:
+    """print() 출력을 바로 클라이언트로 보내는 파일 객체"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text):
+        if text:
+            _send(self.wfile, out=text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def _exit_code(e):
+    if e.code is None or isinstance(e.code, int):
+        return e.code or 0
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+def _connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _call(path, **message):
+    """데몬에 메시지 1개를 보내고 응답 줄을 하나씩 돌려주는 제너레이터 (데몬이 없으면 빈 것)"""
+    sock = _connect(path)
+    if sock is None:
+        return
+    with sock, sock.makefile("rwb") as f:
+        _send(f, **message)
+        for line in f:
+            yield json.loads(line)
+
+
+def request(argv, path=SOCKET_PATH):
+    """데몬에서 명령 실행 후 종료 코드 반환
+
+    데몬이 없거나 코드가 바뀌어 재시작 중이면 None (호출 측에서 직접 실행).
+    """
+    received = False
+    for message in _call(path, argv=list(argv), cwd=os.getcwd()):
+        if "out" in message:
+            received = True
+            sys.stdout.write(message["out"])
+        elif "exit" in message:
+            sys.stdout.flush()
+            return message["exit"]
+        elif message.get("stale"):
+            return None
+    if received:
+        print("❌ 데몬 연결이 끊겼습니다")
+        return 1
+    return None
+
+
+def status(path=SOCKET_PATH):
+    """실행 중인 데몬 정보 dict (없으면 None)"""
+    for message in _call(path, ping=True):
+        return message
+    return None
+
+
+def stop(path=SOCKET_PATH):
+    """데몬 종료 요청 (실행 중이 아니었으면 False)"""
+    return any(True for _ in _call(path, stop=True))
+
+
+def serve(dispatch, path=SOCKET_PATH, warm=None):
+    """소켓에서 요청을 받아 dispatch(argv) 로 실행 (stop 요청이나 Ctrl+C 까지)
+
+    warm: 시작할 때 한 번 부르는 함수 (자주 쓰는 모듈/폰트 미리 로드)
+    """
+    if status(path) is not None:
+        print(f"ℹ️  데몬이 이미 실행 중입니다: {path}")
+        return 1
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)  # 죽은 데몬이 남긴 소켓
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    started = time.perf_counter()
+    if warm is not None:
+        warm()
+    code_state = _code_state()
+    state = {"stop": False, "restart": False, "requests": 0}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            message = json.loads(self.rfile.readline() or b"{}")
+            if message.get("ping"):
+                _send(self.wfile, pid=os.getpid(), requests=state["requests"],
+                      uptime=round(time.perf_counter() - started, 1))
+                return
+            if message.get("stop"):
+                state["stop"] = True
+                _send(self.wfile, exit=0)
+                return
+            if _code_state() != code_state:
+                state["restart"] = True
+                _send(self.wfile, stale=True)
+                return
+
+            argv = message.get("argv", [])
+            output = _Output(self.wfile)
+            cwd = os.getcwd()
+            begin = time.perf_counter()
+            try:
+                os.chdir(message.get("cwd", cwd))
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    try:
+                        code = dispatch(argv)
+                    except SystemExit as e:
+                        code = _exit_code(e)
+                    except (BrokenPipeError, ConnectionResetError):
+                        raise
+                    except Exception as e:
+                        print(f"❌ {type(e).__name__}: {e}")
+                        code = 1
+                _send(self.wfile, exit=code)
+            except (BrokenPipeError, ConnectionResetError):
+                code = "클라이언트 연결 끊김"
+            finally:
+                os.chdir(cwd)
+            state["requests"] += 1
+            print(f"⚡ {' '.join(argv)} → {code} ({(time.perf_counter() - begin) * 1000:.0f}ms)")
+
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        print(f"🔥 데몬 시작: {path} (준비 {time.perf_counter() - started:.2f}초, 종료: --stop 또는 Ctrl+C)")
+        try:
+            while not (state["stop"] or state["restart"]):
+                server.handle_request()
+        except KeyboardInterrupt:
+            print("\n👋 데몬 종료")
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    if state["restart"]:
+        print("🔄 코드가 바뀌어 데몬을 다시 시작합니다")
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+    return 0
@@ -0,0 +1,163 @@
+"""
+Google Play Store Feature Graphic (1024x500) 렌더러
+
+create_feature_graphic.py / create_simple_feature_graphic.py / 파이프라인이
+함께 쓰며, 파일 저장은 호출 측에서 한다.
+장식 도형 좌표는 1024x500 캔버스 기준으로 고정되어 있고, 원/하트/포크/나이프는
+shapes 모듈의 안티앨리어싱 도형으로 그린다.
+"""
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from . import resize, shapes
+from .fonts import HEAVY_BOLD, SEMIBOLD, korean_font, text_width
+from .layout import wrap_text
+
+# 혼밥노노 브랜드 컬러
+BRAND_BEIGE = (210, 180, 140)  # #D2B48C
+BRAND_BEIGE_LIGHT = (240, 220, 190)  # 연한 베이지
+TEXT_DARK = (80, 60, 40)  # 어두운 브라운
+
+FEATURE_GRAPHIC_SIZE = (1024, 500)
+
+# 타이틀 그림자 색과 번짐 폭 (px)
+TITLE_SHADOW_COLOR = (200, 170, 130)
+TITLE_SHADOW_SPREAD = 2
+HEART_COLOR = (255, 100, 100)
+
+# 문구 좌우 여백 (이보다 길면 줄바꿈)
+TEXT_MARGIN = 120
+
+# 아이콘에서 추출한 정확한 배경색
+ICON_BACKGROUND_COLOR = (196, 154, 96)
+# 아이콘 세로를 캔버스 높이의 몇 배로 할지
+ICON_SCALE = 1.3
+
+
+def _draw_centered(draw, text, font, y, width, line_height, fill):
+    """캔버스 폭 안에서 줄바꿈해 줄마다 가운데 정렬로 그리고, 마지막 줄의 y 반환"""
+    lines = wrap_text(text, font, width - TEXT_MARGIN * 2, "balanced")
+    for i, line in enumerate(lines):
+        x = (width - text_width(font, line)) // 2
+        draw.text((x, y + i * line_height), line, font=font, fill=fill)
+    return y + (len(lines) - 1) * line_height
+
+
+def _draw_text_shadow(img, xy, text, font, fill, spread):
+    """텍스트 주변 spread px 까지 번진 그림자를 한 번에 그림
+
+    글자를 오프셋마다 반복해서 그리는 대신 텍스트 bbox 만큼 자른 마스크에 한 번 그리고
+    MaxFilter 로 (2*spread+1) 정사각형만큼 넓혀서 붙인다.
+    """
+    left, top, right, bottom = ImageDraw.Draw(img).textbbox(xy, text, font=font)
+    left, top = left - spread, top - spread
+    mask = Image.new('L', (right - left + spread, bottom - top + spread), 0)
+    ImageDraw.Draw(mask).text((xy[0] - left, xy[1] - top), text, font=font, fill=255)
+    mask = mask.filter(ImageFilter.MaxFilter(spread * 2 + 1))
+    img.paste(fill, (left, top, left + mask.width, top + mask.height), mask)
+
+
+def render_feature_graphic(title="혼밥노노", subtitle="맛집 동행 매칭 서비스",
+                           tagline="혼자는 좋지만 맛집은 함께",
+                           title_size=90, subtitle_size=36, tagline_size=28):
+    """간단하고 깔끔한 Feature Graphic 이미지 생성"""
+    width, height = FEATURE_GRAPHIC_SIZE
+
+    # 배경 생성 (베이지 그라데이션)
+    img = Image.new('RGB', (width, height), BRAND_BEIGE_LIGHT)
+    draw = ImageDraw.Draw(img)
+
+    # 심플한 패턴 추가 (원형 요소들)
+    # 왼쪽 큰 원
+    shapes.fill(img, shapes.ellipse_box([50, 100, 350, 400]), BRAND_BEIGE)
+
+    # 오른쪽 작은 원들
+    shapes.fill(img, shapes.ellipse_box([850, 50, 950, 150]), BRAND_BEIGE)
+    shapes.fill(img, shapes.ellipse_box([900, 320, 980, 400]), BRAND_BEIGE)
+
+    # 중앙 콘텐츠 영역
+    # 타이틀 폰트 (더 크게, 폰트가 없으면 기본 폰트)
+    title_font = korean_font(title_size, indexes=(HEAVY_BOLD,))  # Bold
+    subtitle_font = korean_font(subtitle_size, indexes=(SEMIBOLD,))  # SemiBold
+    tagline_font = korean_font(tagline_size, indexes=(SEMIBOLD,))  # SemiBold
+
+    # 메인 타이틀 "혼밥노노"
+    title_x = (width - text_width(title_font, title)) // 2
+    title_y = 140
+
+    # 타이틀 그림자 효과 (마스크 한 장을 넓혀서 한 번에)
+    _draw_text_shadow(img, (title_x, title_y), title, title_font,
+                      TITLE_SHADOW_COLOR, TITLE_SHADOW_SPREAD)
+
+    # 메인 타이틀
+    draw.text((title_x, title_y), title, font=title_font, fill=TEXT_DARK)
+
+    # 서브타이틀 (길면 줄바꿈, 늘어난 줄 수만큼 태그라인을 내림)
+    subtitle_y = title_y + 100
+    subtitle_y = _draw_centered(draw, subtitle, subtitle_font, subtitle_y, width,
+                                round(subtitle_size * 1.3), TEXT_DARK)
+
+    # 태그라인
+    tagline_y = subtitle_y + 70
+    _draw_centered(draw, tagline, tagline_font, tagline_y, width,
+                   round(tagline_size * 1.3), (120, 90, 60))
+
+    # 아이콘 요소 추가 (간단한 심볼)
+    # 포크와 나이프 심볼
+    icon_y = 370
+    icon_spacing = 200
+    center_x = width // 2
+
+    # 왼쪽 포크 아이콘 (손잡이 + 살 2개)
+    fork_x = center_x - icon_spacing
+    shapes.fill(img, shapes.union(
+        shapes.segment((fork_x, icon_y), (fork_x, icon_y + 60), 4),
+        shapes.segment((fork_x - 10, icon_y), (fork_x - 10, icon_y + 20), 3),
+        shapes.segment((fork_x + 10, icon_y), (fork_x + 10, icon_y + 20), 3),
+    ), TEXT_DARK)
+
+    # 중앙 하트 (두 개의 원과 삼각형을 합친 도형 하나)
+    heart_x = center_x
+    heart_y = icon_y + 10
+    shapes.fill(img, shapes.union(
+        shapes.ellipse_box([heart_x - 15, heart_y - 10, heart_x + 5, heart_y + 10]),
+        shapes.ellipse_box([heart_x - 5, heart_y - 10, heart_x + 15, heart_y + 10]),
+        shapes.polygon([(heart_x - 18, heart_y + 5), (heart_x + 18, heart_y + 5), (heart_x, heart_y + 30)]),
+    ), HEART_COLOR)
+
+    # 오른쪽 나이프 아이콘 (손잡이 + 날 끝)
+    knife_x = center_x + icon_spacing
+    shapes.fill(img, shapes.union(
+        shapes.segment((knife_x, icon_y), (knife_x, icon_y + 60), 4),
+        shapes.polygon([(knife_x - 10, icon_y), (knife_x + 10, icon_y), (knife_x, icon_y - 15)]),
+    ), TEXT_DARK)
+
+    return img
+
+
+def icon_size(size, scale=ICON_SCALE):
+    """아이콘 크기 (세로를 캔버스 높이에 맞춘 뒤 scale 배 확대)"""
+    height = FEATURE_GRAPHIC_SIZE[1]
+    aspect_ratio = size[0] / size[1]
+    return int(int(height * aspect_ratio) * scale), int(height * scale)
+
+
+def place_icon(icon, background=ICON_BACKGROUND_COLOR):
+    """icon_size 로 줄인 아이콘을 배경색 캔버스 중앙에 놓은 Feature Graphic 이미지"""
+    width, height = FEATURE_GRAPHIC_SIZE
+    img = Image.new('RGB', (width, height), tuple(background))
+
+    # 아이콘을 중앙에 배치 (알파 채널 처리)
+    icon_x = (width - icon.width) // 2
+    icon_y = (height - icon.height) // 2
+    if icon.mode == 'RGBA':
+        img.paste(icon, (icon_x, icon_y), icon)
+    else:
+        img.paste(icon, (icon_x, icon_y))
+    return img
+
+
+def render_simple_feature_graphic(icon, background=ICON_BACKGROUND_COLOR, scale=ICON_SCALE,
+                                  quality=resize.DEFAULT_QUALITY):
+    """아이콘을 중앙에 놓고 배경색만 채운 Feature Graphic 이미지 생성"""
+    return place_icon(resize.resize(icon, icon_size(icon.size, scale), quality=quality), background)
@@ -0,0 +1,50 @@
+"""
+폰트 로딩 및 텍스트 폭 측정 캐시
+
+AppleSDGothicNeo.ttc 는 (경로, 크기, index) 조합마다 한 번만 파싱하고,
+글자/줄 폭 측정 결과도 메모이즈해서 줄바꿈(layout)과 가운데 정렬이 함께 쓴다.
+"""
+
+from functools import lru_cache
+
+from PIL import ImageFont
+
+# 한국어 폰트 (AppleSDGothicNeo) 와 TTC 안의 굵기별 index
+KOREAN_FONT_PATH = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
+SEMIBOLD = 5
+BOLD = 6
+HEAVY_BOLD = 7
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size, index=0):
+    """(경로, 크기, index) 별로 한 번만 로드 (실패 시 OSError 그대로 전달)"""
+    return ImageFont.truetype(path, size, index=index)
+
+
+@lru_cache(maxsize=None)
+def korean_font(size, indexes=(SEMIBOLD, BOLD), path=KOREAN_FONT_PATH):
+    """indexes 순서대로 시도해서 처음 로드되는 굵기 사용, 모두 실패하면 기본 폰트
+
+    실패한 경우도 캐시하므로 폰트가 없는 환경에서 TTC를 반복해서 열지 않는다.
+    """
+    for index in indexes:
+        try:
+            return load_font(path, size, index)
+        except (OSError, ValueError):
+            continue
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=65536)
+def text_width(font, text):
+    """한 줄 텍스트의 bbox 폭 (draw.textbbox 와 같은 값, 가운데 정렬용)"""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+@lru_cache(maxsize=65536)
+def advance_width(font, text):
+    """글자/공백의 advance 폭 (줄바꿈 판단용)"""
+    return font.getlength(text)
+
@@ -0,0 +1,164 @@
+"""
+Google Play Store 스타일 스마트폰 프레임 템플릿 캐시
+
+배경, 그림자, 베젤, 둥근 스크린 마스크는 스크린샷 크기와 스타일만 같으면
+항상 똑같으므로 한 번만 합성해 두고 재사용한다.
+  - 메모리: LRU (프로세스 안에서 기기 크기별로 1번만 생성)
+  - 디스크(선택): .build-cache/frames 에 PNG로 저장해 다음 실행/다른 워커와 공유
+"""
+
+import hashlib
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+
+from . import CACHE_DIR
+
+DISK_CACHE_DIR = os.path.join(CACHE_DIR, "frames")
+
+FrameStyle = namedtuple("FrameStyle", [
+    "background",     # 프레임 배경색 (연한 베이지)
+    "bezel",          # 스마트폰 베젤 색
+    "shadow",         # 그림자 색 (RGBA)
+    "shadow_offset",  # 그림자 오프셋 (px)
+    "phone_radius",   # 베젤 모서리 반경
+    "screen_radius",  # 스크린 모서리 반경
+    "screen_padding", # 베젤 안쪽 패딩
+    "margin_x",       # 좌우 여백
+    "margin_top",     # 상단 여백 (텍스트 영역 포함)
+    "margin_bottom",  # 하단 여백
+])
+
+# 혼밥노노 브랜드 기본 스타일
+DEFAULT_STYLE = FrameStyle(
+    background=(240, 220, 190),
+    bezel=(40, 40, 40),
+    shadow=(0, 0, 0, 50),
+    shadow_offset=8,
+    phone_radius=30,
+    screen_radius=22,
+    screen_padding=8,
+    margin_x=100,
+    margin_top=230,
+    margin_bottom=70,
+)
+
+# 미리보기 축소 시 함께 줄이는 길이 값
+_LENGTH_FIELDS = ("shadow_offset", "phone_radius", "screen_radius", "screen_padding",
+                  "margin_x", "margin_top", "margin_bottom")
+
+
+def scaled_style(style, scale):
+    """길이 값만 scale 배로 줄인 스타일 (색은 그대로, 미리보기용)"""
+    return style._replace(**{field: max(1, round(getattr(style, field) * scale))
+                             for field in _LENGTH_FIELDS})
+
+
+# canvas: 배경+그림자+베젤이 합성된 RGB 이미지 (복사해서 사용)
+# screen_box: 스크린샷을 붙일 (x, y, width, height)
+# screen_mask: 스크린 영역 둥근 모서리 마스크 (L)
+FrameTemplate = namedtuple("FrameTemplate", ["canvas", "screen_box", "screen_mask"])
+
+
+def screen_box(width, height, style=DEFAULT_STYLE):
+    """스크린샷 크기(width x height)의 프레임에서 스크린 영역 (x, y, width, height)"""
+    padding = style.screen_padding
+    return (style.margin_x + padding, style.margin_top + padding,
+            width - padding * 2, height - padding * 2)
+
+
+def _fill_rounded(frame, box, radius, color):
+    """frame(RGB)의 box 영역에 둥근 사각형을 채움
+
+    불투명 색은 바로 그리고, 반투명 색(RGBA)은 사각형 크기의 L 마스크로만 블렌딩한다.
+    (불투명 배경 위 alpha_composite 와 같은 결과)
+    """
+    if len(color) < 4 or color[3] == 255:
+        ImageDraw.Draw(frame).rounded_rectangle(box, radius=radius, fill=tuple(color[:3]))
+        return
+    left, top, right, bottom = box
+    mask = Image.new('L', (right - left + 1, bottom - top + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, right - left, bottom - top],
+                                           radius=radius, fill=color[3])
+    frame.paste(tuple(color[:3]), (left, top, right + 1, bottom + 1), mask)
+
+
+def _build_template(width, height, style):
+    """스크린샷 크기(width x height)에 맞는 프레임 템플릿 생성
+
+    배경 전체를 RGBA 레이어로 합성하지 않고 RGB 캔버스 위에서 그림자/베젤 사각형
+    영역만 블렌딩한다.
+    """
+    frame_width = width + style.margin_x * 2
+    frame_height = height + style.margin_top + style.margin_bottom
+    phone_x = style.margin_x
+    phone_y = style.margin_top
+    offset = style.shadow_offset
+
+    frame = Image.new('RGB', (frame_width, frame_height), style.background)
+
+    # 스마트폰 배경 (그림자 효과)
+    _fill_rounded(frame, [phone_x + offset, phone_y + offset,
+                          phone_x + width + offset, phone_y + height + offset],
+                  style.phone_radius, style.shadow)
+
+    # 스마트폰 프레임 (둥근 모서리)
+    _fill_rounded(frame, [phone_x, phone_y, phone_x + width, phone_y + height],
+                  style.phone_radius, style.bezel)
+
+    # 스마트폰 스크린 영역 (내부 패딩)
+    box = screen_box(width, height, style)
+    screen_mask = Image.new('L', box[2:], 0)
+    ImageDraw.Draw(screen_mask).rounded_rectangle(
+        [0, 0, box[2], box[3]], radius=style.screen_radius, fill=255
+    )
+    return FrameTemplate(frame, box, screen_mask)
+
+
+def _disk_paths(width, height, style):
+    digest = hashlib.sha256(repr((width, height, tuple(style))).encode()).hexdigest()[:16]
+    base = os.path.join(DISK_CACHE_DIR, f"{width}x{height}_{digest}")
+    return base + "_frame.png", base + "_mask.png"
+
+
+def _load_from_disk(width, height, style):
+    frame_path, mask_path = _disk_paths(width, height, style)
+    try:
+        with Image.open(frame_path) as canvas, Image.open(mask_path) as mask:
+            canvas.load()
+            mask.load()
+    except (OSError, ValueError):
+        return None
+    box = screen_box(width, height, style)
+    if canvas.mode != 'RGB' or mask.mode != 'L' or mask.size != box[2:]:
+        return None
+    return FrameTemplate(canvas, box, mask)
+
+
+def _save_to_disk(width, height, style, template):
+    frame_path, mask_path = _disk_paths(width, height, style)
+    os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+    # 다른 워커와 동시에 쓰더라도 깨진 파일이 보이지 않도록 임시 파일 후 교체
+    for image, path in ((template.canvas, frame_path), (template.screen_mask, mask_path)):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        image.save(tmp_path, 'PNG', compress_level=1)
+        os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=16)
+def frame_template(width, height, style=DEFAULT_STYLE, disk_cache=False):
+    """기기 크기별 프레임 템플릿 (LRU 캐시, disk_cache=True면 디스크 캐시도 사용)
+
+    반환된 canvas는 여러 호출이 공유하므로 반드시 copy() 후 그려야 한다.
+    """
+    if disk_cache:
+        template = _load_from_disk(width, height, style)
+        if template is not None:
+            return template
+
+    template = _build_template(width, height, style)
+    if disk_cache:
+        _save_to_disk(width, height, style, template)
+    return template
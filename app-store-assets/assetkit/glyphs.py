@@ -0,0 +1,150 @@
+"""
+캡션 글자 줄(glyph run) 마스크 캐시
+
+같은 제목/부제목은 기기 크기가 달라도 폰트 크기가 같으면 똑같이 래스터화된다.
+줄 하나를 (텍스트, 폰트, 크기) 별로 한 번만 그려 L 모드 마스크로 남기고, 캡션은
+줄 마스크들을 합친 마스크 하나를 paste 한 번으로 색칠한다.
+  - 메모리: 프로세스 안에서 최근 MAX_MASKS 개 LRU (데몬/watch/워커에서 재사용)
+  - 디스크: .build-cache/glyphs/<키>.glyph 에 작은 헤더 + 압축 없는 픽셀
+    (Pillow/FreeType 버전이 바뀌면 키가 달라져 다시 그린다)
+
+draw.text 와 같은 FreeType 마스크를 같은 블렌딩(ImagingFill2)으로 칠하므로 줄끼리 겹치지
+않으면 결과 픽셀이 같다. 겹치는 안티에일리어싱 픽셀만 반올림 1 정도 다를 수 있다.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, features
+
+from . import CACHE_DIR
+from .raw_cache import prune_dir
+
+GLYPH_DIR = os.path.join(CACHE_DIR, "glyphs")
+
+# 오래된 파일부터 지워 이 크기 이하로 유지
+MAX_BYTES = 64 * 1024 ** 2
+
+_MAGIC = b"HBGLY1\0\0"
+# magic, bbox 왼쪽, bbox 위, width, height
+_HEADER = struct.Struct("<8siiII")
+
+# 래스터화 결과가 달라질 수 있는 라이브러리 버전
+_RENDERER = [Image.__version__, features.version("freetype2")]
+
+# 메모리에 남기는 줄 마스크 수 (데몬처럼 오래 사는 프로세스에서 캡션이 바뀌어도 이 이하)
+MAX_MASKS = 1024
+
+_masks = OrderedDict()
+_lock = threading.Lock()
+
+
+def _font_id(font):
+    """폰트 파일/이름/크기/index (load_default 처럼 파일 경로가 없으면 이름만)"""
+    path = getattr(font, "path", None)
+    name = font.getname() if hasattr(font, "getname") else type(font).__name__
+    return [path if isinstance(path, str) else None, name,
+            getattr(font, "size", None), getattr(font, "index", None)]
+
+
+def glyph_key(font, text):
+    """(텍스트, 폰트, 크기) 캐시 키"""
+    data = json.dumps([text, _font_id(font), _RENDERER], ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def glyph_path(key):
+    return os.path.join(GLYPH_DIR, f"{key}.glyph")
+
+
+def _load(key):
+    try:
+        with open(glyph_path(key), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, left, top, width, height = _HEADER.unpack_from(data)
+    if magic != _MAGIC or len(data) != _HEADER.size + width * height:
+        return None
+    # 최근에 쓴 파일이 prune() 에서 살아남도록 수정 시각 갱신
+    # (그 사이 다른 빌드의 prune() 이 지웠으면 미적중으로 보고 다시 그림)
+    try:
+        os.utime(glyph_path(key))
+    except FileNotFoundError:
+        return None
+    return (left, top), Image.frombytes("L", (width, height), data[_HEADER.size:])
+
+
+def _save(key, origin, mask):
+    os.makedirs(GLYPH_DIR, exist_ok=True)
+    path = glyph_path(key)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, origin[0], origin[1], mask.width, mask.height))
+        f.write(mask.tobytes())
+    os.replace(tmp_path, path)
+
+
+def _rasterize(font, text):
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(0, right - left), max(0, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return (left, top), mask
+
+
+def glyph_mask(font, text, disk_cache=True):
+    """한 줄 텍스트의 ((bbox 왼쪽, 위), L 마스크) (draw.text((0, 0)) 기준 좌표)
+
+    반환된 마스크는 캐시가 공유하므로 수정하지 않는다.
+    """
+    key = glyph_key(font, text)
+    with _lock:
+        cached = _masks.get(key)
+        if cached is not None:
+            _masks.move_to_end(key)
+            return cached
+    if disk_cache:
+        cached = _load(key)
+    if cached is None:
+        cached = _rasterize(font, text)
+        if disk_cache and cached[1].width and cached[1].height:
+            _save(key, *cached)
+    with _lock:
+        _masks[key] = cached
+        while len(_masks) > MAX_MASKS:
+            _masks.popitem(last=False)
+    return cached
+
+
+def clear():
+    """메모리 캐시 비우기 (벤치마크에서 래스터화 시간을 잴 때)"""
+    with _lock:
+        _masks.clear()
+
+
+def runs_mask(runs, disk_cache=True):
+    """layout_caption 줄 배치 [((x, y), 줄, 폰트), ...] 를 합친 (box, L 마스크) (줄이 없으면 None)"""
+    placed = []
+    for (x, y), line, font in runs:
+        (left, top), mask = glyph_mask(font, line, disk_cache)
+        if mask.width and mask.height:
+            placed.append(((x + left, y + top), mask))
+    if not placed:
+        return None
+    box = (min(x for (x, _), _ in placed), min(y for (_, y), _ in placed),
+           max(x + mask.width for (x, _), mask in placed), max(y + mask.height for (_, y), mask in placed))
+    combined = Image.new("L", (box[2] - box[0], box[3] - box[1]), 0)
+    for (x, y), mask in placed:
+        combined.paste(255, (x - box[0], y - box[1]), mask)
+    return box, combined
+
+
+def prune(max_bytes=MAX_BYTES):
+    """오래된 마스크 파일부터 지워 전체 크기를 max_bytes 이하로"""
+    prune_dir(GLYPH_DIR, ".glyph", max_bytes)
@@ -0,0 +1,124 @@
+"""
+캡션 줄바꿈 엔진 (스크린샷 캡션 / Feature Graphic 공용)
+
+  - 글자별 advance 폭은 (폰트, 글자) 마다 한 번만 재고, 어절 폭은 그 합으로 구한다.
+    접두어마다 다시 재지 않는다.
+  - 줄바꿈 위치는 공백(어절 경계)이 기본이다. 한 어절이 한 줄보다 길면 음절 사이에서
+    나누되, 닫는 문장부호(.,!? 등)가 줄 맨 앞에 오지 않게 한다.
+  - 줄 나누기 방식
+      "greedy":   앞에서부터 들어가는 만큼 채움
+      "balanced": Knuth-Plass 식 동적 계획법으로 줄마다 남는 폭의 제곱합을 최소화
+                  (가운데 정렬 캡션에서 마지막 줄만 짧게 남는 것을 피함)
+  - '\n' 은 강제 줄바꿈
+  - 결과는 (텍스트, 폰트, 최대 폭, 방식) 별로 메모이즈
+"""
+
+from functools import lru_cache
+
+from .fonts import advance_width, text_width
+
+LINE_BREAKING = ("greedy", "balanced")
+
+# 줄 맨 앞에 오면 안 되는 글자 / 줄 맨 끝에 오면 안 되는 글자
+_NO_LINE_START = set(".,!?:;)]}%…~”’」』〉》")
+_NO_LINE_END = set("([{“‘「『〈《")
+
+
+def glyph_advances(font, text):
+    """글자별 advance 폭 목록 (글자 단위로 캐시)"""
+    return [advance_width(font, char) for char in text]
+
+
+def _split_long_word(word, widths, max_width):
+    """max_width 보다 긴 어절을 음절 사이에서 나눈 [(조각, 폭), ...]"""
+    pieces = []
+    start = 0
+    width = 0.0
+    for i, char_width in enumerate(widths):
+        if i > start and width + char_width > max_width:
+            # 금칙 문자는 앞 조각에 붙이거나 뒤 조각으로 넘김
+            cut = i
+            while cut > start + 1 and (word[cut] in _NO_LINE_START or word[cut - 1] in _NO_LINE_END):
+                cut -= 1
+            pieces.append((word[start:cut], sum(widths[start:cut])))
+            start = cut
+            width = sum(widths[start:i])
+        width += char_width
+    pieces.append((word[start:], sum(widths[start:])))
+    return pieces
+
+
+def _items(paragraph, font, max_width):
+    """줄바꿈 단위 [(텍스트, 폭, 앞 공백 폭), ...] (긴 어절은 음절 조각으로)"""
+    space = advance_width(font, " ")
+    items = []
+    for word in paragraph.split():
+        widths = glyph_advances(font, word)
+        pieces = [(word, sum(widths))]
+        if pieces[0][1] > max_width:
+            pieces = _split_long_word(word, widths, max_width)
+        for i, (text, width) in enumerate(pieces):
+            glue = space if items and i == 0 else 0.0
+            items.append((text, width, glue))
+    return items
+
+
+def _line_text(items):
+    return "".join((" " if glue and n else "") + text for n, (text, _, glue) in enumerate(items))
+
+
+def _greedy(items, max_width):
+    breaks = []
+    start = 0
+    width = 0.0
+    for i, (_, item_width, glue) in enumerate(items):
+        if i > start and width + glue + item_width > max_width:
+            breaks.append(i)
+            start = i
+            width = item_width
+        else:
+            width += (glue if i > start else 0.0) + item_width
+    return breaks
+
+
+def _balanced(items, max_width):
+    """줄마다 (max_width - 줄 폭)^2 의 합이 최소가 되는 줄바꿈 위치"""
+    count = len(items)
+    best = [0.0] + [float("inf")] * count  # best[j]: items[:j] 를 배치하는 최소 비용
+    previous = [0] * (count + 1)
+    for j in range(1, count + 1):
+        width = 0.0
+        for i in range(j - 1, -1, -1):
+            width += items[i][1] + (items[i + 1][2] if i + 1 < j else 0.0)
+            if width > max_width and i < j - 1:
+                break
+            cost = best[i] + (max_width - width) ** 2
+            if cost < best[j]:
+                best[j] = cost
+                previous[j] = i
+    breaks = []
+    j = count
+    while j > 0:
+        breaks.append(previous[j])
+        j = previous[j]
+    return sorted(breaks)[1:]
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text, font, max_width, mode="greedy"):
+    """text 를 max_width 안에 들어가는 줄들로 나눈 튜플
+
+    문단('\n' 단위)이 이미 한 줄에 들어가면 (bbox 폭 기준) 그대로 둔다.
+    """
+    if mode not in LINE_BREAKING:
+        raise ValueError(f"알 수 없는 줄바꿈 방식: {mode}")
+    lines = []
+    for paragraph in text.split("\n"):
+        if text_width(font, paragraph) <= max_width:
+            lines.append(paragraph)
+            continue
+        items = _items(paragraph, font, max_width)
+        breaks = (_balanced if mode == "balanced" else _greedy)(items, max_width)
+        for start, end in zip([0] + breaks, breaks + [len(items)]):
+            lines.append(_line_text(items[start:end]))
+    return tuple(lines)
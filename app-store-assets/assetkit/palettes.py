@@ -0,0 +1,169 @@
+"""
+에셋 이미지 일괄 색상 분석 + 결과 캐시
+
+아이콘, 원본/결과 스크린샷 등 에셋 폴더의 이미지를 스레드 풀로 분석해서
+대표 색(dominant)과 k-means 팔레트를 .build-cache/palettes.json 에 파일 해시별로
+저장한다. 파일이 그대로면 다시 열지 않는다.
+
+생성 스크립트는 dominant_color(path) 로 조회만 하면 된다.
+(예: assets.json 의 icon 그래픽 "background": "auto")
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from . import ASSETS_DIR, CACHE_DIR
+from .build_cache import BuildCache
+from .colors import dominant_colors, kmeans_palette
+from .spec import icon_paths, load_spec
+
+PALETTE_CACHE_PATH = os.path.join(CACHE_DIR, "palettes.json")
+# 분석 방식이 바뀌면 올려서 기존 결과를 무효화
+ANALYSIS_VERSION = 1
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# 분석용 축소 기준 (이보다 큰 JPEG 은 draft 로 작게 디코드, 나머지는 격자 샘플링)
+ANALYSIS_PIXELS = 250_000
+# 이 알파 미만 픽셀(투명 배경)은 색 계산에서 제외
+MIN_ALPHA = 128
+TOP_COLORS = 5
+PALETTE_SIZE = 5
+
+_lock = threading.Lock()
+
+# 읽은 캐시 파일 {경로: (mtime, entries)} (assets.py daemon 처럼 오래 사는 프로세스에서 재사용)
+_loaded = {}
+
+
+def default_roots(spec_path=None):
+    """기본 분석 대상: app-store-assets 폴더 + 스펙의 아이콘 (flutter-app 쪽에 있음)
+
+    스펙을 읽을 수 없으면 에셋 폴더만
+    """
+    try:
+        icons = icon_paths(load_spec(spec_path))
+    except (OSError, ValueError) as e:
+        print(f"⚠️  스펙을 읽지 못해 아이콘은 건너뜁니다: {e}")
+        icons = []
+    return [ASSETS_DIR] + [path for path in icons if not path.startswith(ASSETS_DIR + os.sep)]
+
+
+def asset_images(roots=None):
+    """roots(기본값: default_roots())의 이미지 경로 목록 (.build-cache 제외)"""
+    paths = []
+    for root in roots or default_roots():
+        if os.path.isfile(root):
+            paths.append(os.path.abspath(root))
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            paths.extend(os.path.join(dirpath, name) for name in sorted(filenames)
+                         if name.lower().endswith(IMAGE_EXTENSIONS))
+    return paths
+
+
+def _open_downsampled(path):
+    with Image.open(path) as image:
+        # JPEG 은 DCT 스케일링으로 처음부터 작게 디코드
+        if image.format == "JPEG" and image.width * image.height > ANALYSIS_PIXELS * 4:
+            image.draft("RGB", (image.width // 2, image.height // 2))
+        image.load()
+        return image
+
+
+def analyze_image(path):
+    """이미지 1장 분석 결과 dict (JSON 으로 저장 가능한 형태)"""
+    image = _open_downsampled(path)
+    top = dominant_colors(image, top=TOP_COLORS, max_pixels=ANALYSIS_PIXELS, min_alpha=MIN_ALPHA)
+    palette = kmeans_palette(image, k=PALETTE_SIZE, max_pixels=ANALYSIS_PIXELS, min_alpha=MIN_ALPHA)
+    return {
+        "size": list(image.size),
+        "dominant": list(top[0][0]) if top else None,
+        "top": [[list(color), count] for color, count in top],  # 샘플링한 픽셀 수
+        "palette": [[list(color), round(share, 4)] for color, share in palette],
+    }
+
+
+class PaletteCache:
+    """파일 해시 → 분석 결과 캐시 (해시는 빌드 캐시 manifest 의 크기·mtime 메모 재사용)"""
+
+    def __init__(self, path=PALETTE_CACHE_PATH, build_cache=None):
+        self.path = path
+        self.build_cache = build_cache or BuildCache()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            loaded = _loaded.get(path)
+            if loaded is not None and loaded[0] == mtime:
+                self.entries = dict(loaded[1])
+            else:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == ANALYSIS_VERSION:
+                    self.entries = data.get("entries", {})
+                _loaded[path] = (mtime, dict(self.entries))
+        except (OSError, ValueError):
+            pass
+
+    def lookup(self, path):
+        """분석 결과 (캐시에 없으면 분석 후 저장, 파일이 없으면 FileNotFoundError)"""
+        # 해시 메모 갱신은 dict 대입 한 번이라 잠그지 않음 (해시 계산은 스레드별 병렬)
+        digest = self.build_cache.file_digest(path)
+        if digest is None:
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+        entry = self.entries.get(digest)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        entry = analyze_image(path)
+        with _lock:
+            self.entries[digest] = entry
+            self.misses += 1
+        return entry
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": ANALYSIS_VERSION, "entries": self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.build_cache.save()
+
+
+def analyze_all(paths, jobs=None, cache=None):
+    """여러 이미지를 스레드 풀로 분석해 {경로: 결과 또는 예외} 반환
+
+    Pillow 디코드와 NumPy 연산은 GIL 을 놓기 때문에 스레드로도 병렬이 된다.
+    """
+    cache = cache or PaletteCache()
+
+    def lookup(path):
+        try:
+            return cache.lookup(path)
+        except (OSError, ValueError) as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        results = dict(zip(paths, pool.map(lookup, paths)))
+    cache.save()
+    return results
+
+
+def dominant_color(path, default=None, build_cache=None):
+    """이미지의 대표 색 (r, g, b) (캐시 사용, 분석할 수 없으면 default)"""
+    cache = PaletteCache(build_cache=build_cache)
+    try:
+        entry = cache.lookup(path)
+    except (OSError, ValueError):
+        return default
+    if cache.misses:
+        cache.save()
+    return tuple(entry["dominant"]) if entry["dominant"] else default
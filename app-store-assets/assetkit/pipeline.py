@@ -0,0 +1,832 @@
+"""
+스펙 기반 에셋 빌드 파이프라인
+
+렌더링을 단계(stage)로 나눈 의존성 그래프를 만든다.
+  스크린샷: source(원본 디코드) → scale(스크린 크기로 축소) → frame(프레임 합성)
+            → caption(텍스트) → encode(저장)
+  Feature Graphic: feature_graphic / icon_graphic(← source → scale) → encode
+  --tiled 스크린샷: source → tiled(가로 띠 단위로 합성하면서 바로 저장, 4-8K 캔버스용)
+  --export 규격 변형: 렌더링 결과 → pyramid(큰 크기부터 이전 축소본을 다시 축소)
+                      → variant(규격 캔버스에 여백 채우기) → encode
+
+단계 키는 자기 파라미터 + 관련 코드/폰트 파일 해시 + 입력 단계 키로 만들기 때문에
+같은 키의 단계는 한 번만 계산되고 (예: 같은 원본의 frame), 입력이 바뀌면 그 아래
+단계 키가 전부 바뀐다. 출력 파일의 키가 manifest 와 같으면 그 출력으로 이어지는
+단계는 실행하지 않는다. 다시 만들어야 하는 출력은 원본 단계별로 묶어서 하나의
+배치 작업으로 프로세스 풀에 보낸다. 한 배치 안에서는 원본을 한 번만 디코드/합성하고
+로케일별 캡션을 사본에 찍어 바로 디스크에 쓴다.
+
+scale 은 원본 크기를 헤더만 읽어 그래프를 만들 때 목표 크기를 정하므로 키가 (원본 파일 해시,
+목표 크기, 축소 품질) 로 정해진다. --resize-quality 가 reduce → LANCZOS 2단계 축소의
+배율을 고른다 (assetkit.resize).
+
+scale/frame 결과(축소본, 텍스트 없는 합성본)는 .build-cache/raw 에 원시 픽셀로 남겨 두고
+다음 실행에서 mmap 으로 바로 연다. 캡션/인코딩 옵션만 바뀌면 원본 디코드와 합성을,
+프레임 스타일만 바뀌면 원본 디코드와 축소를 건너뛴다.
+
+--shared-memory 를 주면 원본 디코드는 메인 프로세스가 하고, 디코드한 픽셀을 공유 메모리
+블록 링(assetkit.shared_images)으로 워커에 넘긴다. 워커는 pickle 없이 블록을 그대로 연다.
+
+encode 는 배치 안에서 스레드 풀로 병렬 처리한다 (Pillow 인코더는 GIL 을 놓는다).
+--report-bytes 를 주면 포맷별 최적화 옵션(progressive/optimize/method)으로 줄어든
+바이트 수를 기본 옵션 인코딩과 비교해 보여준다.
+
+--profile 을 주면 출력 1개마다 단계별 wall/CPU 시간, 이미지 크기, 출력 바이트 수를
+JSON Lines 로 남기고, --cprofile 을 주면 모든 배치의 cProfile 통계를 합쳐 저장한다.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import tempfile
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from PIL import Image
+
+from . import (feature_graphic, fonts, frame, glyphs, palettes, profiling, raw_cache, resize,
+               screenshot, shared_images, tiled)
+from .build_cache import BuildCache
+from .fonts import KOREAN_FONT_PATH
+from .frame import FrameStyle, scaled_style
+from .raw_cache import prune as prune_raw_cache
+from .screenshot import CaptionStyle, scaled_caption
+from .spec import SpecError, graphic_entries, load_spec, screenshot_entries
+
+KINDS = ("screenshot", "graphic")
+
+# 미리보기 축소 배율 (JPEG DCT 스케일링이 지원하는 1/2, 1/4, 1/8)
+PREVIEW_FACTORS = (2, 4, 8)
+PREVIEW_DIR = "preview"
+
+Stage = namedtuple("Stage", ["key", "kind", "params", "deps"])
+
+# 출력 파일 1개 (label: 출력용 이름, key: encode 단계 키)
+Target = namedtuple("Target", ["label", "path", "key"])
+
+# 단계 종류별로 결과에 영향을 주는 코드/폰트 파일 (단계 키에 포함)
+_STAGE_FILES = {
+    "source": [],
+    "scale": [resize.__file__],
+    "frame": [frame.__file__, screenshot.__file__],
+    "caption": [fonts.__file__, glyphs.__file__, screenshot.__file__, KOREAN_FONT_PATH],
+    "feature_graphic": [feature_graphic.__file__, fonts.__file__, KOREAN_FONT_PATH],
+    "icon_graphic": [feature_graphic.__file__],
+    "pyramid": [],
+    "variant": [],
+    "encode": [],
+    "tiled": [tiled.__file__, frame.__file__, screenshot.__file__, fonts.__file__, glyphs.__file__,
+              KOREAN_FONT_PATH],
+}
+
+# 결과를 .build-cache/raw 에 원시 픽셀로 남기는 단계
+_RAW_CACHED_KINDS = ("scale", "frame")
+
+# --report-bytes 비교용 기본 인코딩에 남기는 옵션 (화질에 영향을 주는 것만)
+_PLAIN_OPTIONS = {
+    "JPEG": ("quality", "subsampling"),
+    "PNG": (),
+    "WEBP": ("quality", "lossless"),
+}
+
+
+class BuildGraph:
+    """단계 의존성 그래프 (키가 같은 단계는 하나로 합쳐짐)"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.stages = {}
+        self.targets = []
+
+    def add(self, kind, params, deps=(), files=()):
+        key = self.cache.key(files=list(files) + _STAGE_FILES[kind],
+                             kind=kind, params=params, deps=list(deps))
+        self.stages.setdefault(key, Stage(key, kind, params, tuple(deps)))
+        return key
+
+    def add_source(self, path, reduce=1):
+        params = {"path": path}
+        if reduce > 1:
+            params["reduce"] = reduce
+        return self.add("source", params, files=[path])
+
+    def add_outputs(self, label, image_key, outputs, preview=False):
+        """출력 목록 추가 (size 가 있는 출력은 pyramid 하나를 공유)"""
+        sizes = sorted({tuple(output.size) for output in outputs if output.size})
+        pyramid = self.add("pyramid", {"sizes": sizes}, [image_key]) if sizes else None
+        for output in outputs:
+            key = image_key
+            if output.size:
+                key = self.add("variant", {"size": output.size, "fit": output.fit,
+                                           "background": output.background}, [pyramid])
+            self.add_output(label, key, output, preview)
+
+    def add_output(self, label, image_key, output, preview=False):
+        path = output.path
+        if preview:
+            path = os.path.join(os.path.dirname(path), PREVIEW_DIR, os.path.basename(path))
+        key = self.add("encode", {"path": path, "format": output.format,
+                                  "options": output.options}, [image_key])
+        self.targets.append(Target(label, path, key))
+
+    def root(self, key):
+        """체인의 시작 단계 (배치 묶음 기준)"""
+        while self.stages[key].deps:
+            key = self.stages[key].deps[0]
+        return key
+
+    def closure(self, keys):
+        """keys 를 계산하는 데 필요한 단계 전체"""
+        needed = {}
+        pending = list(keys)
+        while pending:
+            key = pending.pop()
+            if key not in needed:
+                needed[key] = self.stages[key]
+                pending.extend(self.stages[key].deps)
+        return needed
+
+
+def _source_size(path, reduce=1):
+    """원본 이미지 크기 (헤더만 읽음, reduce 배 축소 후 크기, 읽을 수 없으면 None)
+
+    None 이면 그 원본의 source 단계가 실행 중에 에러를 낸다.
+    """
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+    except (OSError, ValueError):
+        return None
+    return [-(-width // reduce), -(-height // reduce)]
+
+
+def build_graph(spec, cache, only=None, kinds=KINDS, locales=None, preview=None, export=False,
+                resize_quality=resize.DEFAULT_QUALITY, strip_height=None):
+    """스펙으로 단계 그래프 생성
+
+    preview 에 축소 배율(2/4/8)을 주면 스크린샷을 JPEG draft 디코드 + BILINEAR 로
+    작게 만들고, 레이아웃 길이 값도 같은 비율로 줄여 출력 폴더의 preview/ 에 저장한다.
+    export=True 면 스펙의 exports (스토어 규격 변형)도 만든다. (미리보기에서는 제외)
+    resize_quality 는 스크린샷/아이콘 축소 품질 (resize.QUALITY_GAPS)
+    strip_height 를 주면 스크린샷의 원본 크기 출력은 그 높이의 띠 단위로 렌더링해 바로 저장한다
+    (규격 크기 출력과 exports 는 전체 합성본에서 만든다, 미리보기에서는 무시)
+    """
+    graph = BuildGraph(cache)
+
+    if "screenshot" in kinds:
+        for entry in screenshot_entries(spec, only, locales):
+            style = entry.frame_style
+            caption_style = entry.caption_style
+            resample = "lanczos"
+            if preview:
+                style = scaled_style(style, 1 / preview)
+                caption_style = scaled_caption(caption_style, 1 / preview)
+                resample = "bilinear"
+
+            source = graph.add_source(entry.input_path, reduce=preview or 1)
+            size = _source_size(entry.input_path, preview or 1)
+            scaled = graph.add("scale", {
+                "size": list(frame.screen_box(*size, style)[2:]) if size else None,
+                "resample": resample,
+                "quality": resize_quality,
+            }, [source])
+            framed = graph.add("frame", {"style": style._asdict(), "size": size}, [scaled])
+            captioned = graph.add("caption", {
+                "title": entry.title,
+                "subtitle": entry.subtitle,
+                "style": caption_style._asdict(),
+            }, [framed])
+            label = f"{entry.name} [{entry.locale}]"
+            outputs = entry.outputs
+            if strip_height and not preview:
+                for output in outputs:
+                    if output.size:
+                        continue
+                    key = graph.add("tiled", {
+                        "style": style._asdict(),
+                        "caption": {"title": entry.title, "subtitle": entry.subtitle,
+                                    "style": caption_style._asdict()},
+                        "strip_height": strip_height,
+                        "path": output.path,
+                        "format": output.format,
+                        "options": output.options,
+                    }, [source])
+                    graph.targets.append(Target(label, output.path, key))
+                outputs = [output for output in outputs if output.size]
+            outputs = outputs + (entry.exports if export and not preview else [])
+            graph.add_outputs(label, captioned, outputs, bool(preview))
+
+    if "graphic" in kinds:
+        for entry in graphic_entries(spec, only):
+            if entry.kind == "icon":
+                params = entry.params
+                if params.get("background") == "auto" and os.path.exists(entry.icon_path):
+                    # 아이콘 대표 색을 배경으로 (팔레트 캐시 조회, 키에는 실제 색이 들어감)
+                    params = dict(params, background=palettes.dominant_color(
+                        entry.icon_path, feature_graphic.ICON_BACKGROUND_COLOR, cache))
+                size = _source_size(entry.icon_path)
+                scaled = graph.add("scale", {
+                    "size": list(feature_graphic.icon_size(
+                        size, params.get("scale", feature_graphic.ICON_SCALE))) if size else None,
+                    "resample": "lanczos",
+                    "quality": resize_quality,
+                }, [graph.add_source(entry.icon_path)])
+                rendered = graph.add("icon_graphic", params, [scaled])
+            else:
+                rendered = graph.add("feature_graphic", entry.params)
+            graph.add_outputs(entry.name, rendered, entry.outputs + (entry.exports if export else []))
+
+    return graph
+
+
+# ---- 단계 실행 (워커 프로세스) ----
+
+def _run_source(params, inputs, options):
+    path = params["path"]
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+    reduce = params.get("reduce", 1)
+    with profiling.stage("decode"), Image.open(path) as img:
+        profiling.annotate(source_size=list(img.size))
+        if reduce == 1:
+            img.load()
+            return img
+
+        # JPEG 은 DCT 스케일링으로 처음부터 작게 디코드 (다른 포맷은 전체 디코드)
+        target = (-(-img.width // reduce), -(-img.height // reduce))
+        img.draft('RGB', target)
+        img.load()
+
+    # draft 로 못 줄인 만큼은 box 축소 후 크기 맞춤
+    with profiling.stage("resize"):
+        factor = img.width // target[0]
+        if factor > 1:
+            img = img.reduce(factor)
+        if img.size != target:
+            img = img.resize(target, Image.Resampling.BILINEAR)
+    return img
+
+
+_RESAMPLE = {
+    "lanczos": Image.Resampling.LANCZOS,
+    "bilinear": Image.Resampling.BILINEAR,
+}
+
+
+def _run_scale(params, inputs, options):
+    with profiling.stage("resize"):
+        return resize.resize(inputs[0], params["size"], _RESAMPLE[params["resample"]],
+                             params["quality"])
+
+
+def _run_frame(params, inputs, options):
+    return screenshot.frame_screen(inputs[0], params["size"], FrameStyle(**params["style"]),
+                                   options.get("disk_frame_cache", False))
+
+
+def _run_caption(params, inputs, options):
+    # 같은 frame 을 여러 로케일이 공유하므로 복사본에 그림
+    # (원시 캐시에서 매핑한 frame 은 RGBX 읽기 전용이라 convert 로 복사)
+    return screenshot.draw_caption(inputs[0].convert('RGB'), params["title"], params["subtitle"],
+                                   CaptionStyle(**params["style"]), disk_cache=True)
+
+
+def _run_feature_graphic(params, inputs, options):
+    with profiling.stage("render"):
+        return feature_graphic.render_feature_graphic(**params)
+
+
+def _run_icon_graphic(params, inputs, options):
+    with profiling.stage("render"):
+        return feature_graphic.place_icon(
+            inputs[0], params.get("background", feature_graphic.ICON_BACKGROUND_COLOR))
+
+
+def _contained_size(size, box):
+    """size 를 비율 유지하며 box 안에 넣은 크기 (확대는 하지 않음)"""
+    scale = min(1.0, box[0] / size[0], box[1] / size[1])
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _run_pyramid(params, inputs, options):
+    """규격 크기별 축소본 {size: 이미지} (큰 것부터 바로 앞 축소본을 다시 줄임)"""
+    master = inputs[0]
+    levels = {}
+    current = master
+    for box in sorted(params["sizes"], key=lambda box: _contained_size(master.size, box), reverse=True):
+        size = _contained_size(master.size, box)
+        if size != current.size:
+            with profiling.stage("resize"):
+                current = current.resize(size, Image.Resampling.LANCZOS)
+        levels[tuple(box)] = current
+    return levels
+
+
+def _run_variant(params, inputs, options):
+    image = inputs[0][tuple(params["size"])]
+    if params["fit"] == "contain" or image.size == tuple(params["size"]):
+        return image
+
+    # 여백은 지정 색이 없으면 왼쪽 위 픽셀 색 (프레임 배경색)으로 채움
+    background = params["background"] or image.getpixel((0, 0))
+    canvas = Image.new(image.mode, tuple(params["size"]), background)
+    canvas.paste(image, ((canvas.width - image.width) // 2, (canvas.height - image.height) // 2))
+    return canvas
+
+
+def _run_encode(params, inputs, options):
+    """파일 저장 후 {"bytes": 파일 크기[, "plain_bytes": 기본 옵션 인코딩 크기]} 반환"""
+    path = params["path"]
+    fmt = params["format"]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with profiling.stage("encode"):
+        inputs[0].save(path, fmt, **params["options"])
+    report = {"bytes": os.path.getsize(path)}
+    profiling.annotate(output_size=list(inputs[0].size), output_bytes=report["bytes"])
+
+    if options.get("report_bytes"):
+        plain = io.BytesIO()
+        inputs[0].save(plain, fmt, **{name: value for name, value in params["options"].items()
+                                      if name in _PLAIN_OPTIONS.get(fmt, ())})
+        report["plain_bytes"] = plain.tell()
+    return report
+
+
+def _run_tiled(params, inputs, options):
+    """띠 단위 렌더링 + 저장 후 {"bytes": 파일 크기} 반환
+
+    plain_bytes 는 만들지 않는다 (비교하려면 전체 캔버스가 필요해서 --tiled 의 의미가 없어짐)
+    """
+    style = FrameStyle(**params["style"])
+    caption = params["caption"]
+    size = tiled.render_to_file(inputs[0], params["path"], caption["title"], caption["subtitle"],
+                                style, CaptionStyle(**caption["style"]), params["format"],
+                                params["options"], params["strip_height"], disk_cache=True)
+    profiling.annotate(output_size=list(tiled.canvas_size(inputs[0].size, style)), output_bytes=size)
+    return {"bytes": size}
+
+
+_EXECUTORS = {
+    "source": _run_source,
+    "scale": _run_scale,
+    "frame": _run_frame,
+    "caption": _run_caption,
+    "feature_graphic": _run_feature_graphic,
+    "icon_graphic": _run_icon_graphic,
+    "pyramid": _run_pyramid,
+    "variant": _run_variant,
+    "encode": _run_encode,
+    "tiled": _run_tiled,
+}
+
+
+class _Batch:
+    """배치 1개의 단계 계산기
+
+    결과는 memo 에 두고, 그 결과를 쓰는 단계가 모두 끝나면 바로 버린다.
+    원본 → frame → 로케일별 caption → encode 순서로 흘러가므로 순서대로 실행하면 메모리에는
+    원본 1장 분량(텍스트 없는 합성본 + 캡션 사본 1장)만 남는다. encode 스레드가 N 개면
+    인코딩 중이거나 기다리는 캡션 사본이 최대 N 장 더 있다 (_evaluate_threaded).
+    """
+
+    def __init__(self, stages, options):
+        self.stages = stages
+        self.options = options
+        self.memo = {}
+        self.consumers = {}
+        # --shared-memory: 메인 프로세스가 디코드해 둔 원본 {단계 키: SharedImage}
+        self.shared = options.get("shared") or {}
+        self.blocks = []
+        for stage in stages.values():
+            for dep in stage.deps:
+                self.consumers[dep] = self.consumers.get(dep, 0) + 1
+
+    def _release(self, key):
+        self.consumers[key] -= 1
+        if self.consumers[key] == 0 and not isinstance(self.memo.get(key), Exception):
+            self.memo.pop(key, None)
+
+    def inputs(self, key):
+        """key 단계의 입력 결과 목록 (memo 의 참조는 바로 반납)"""
+        stage = self.stages[key]
+        inputs = [self.evaluate(dep) for dep in stage.deps]
+        for dep in stage.deps:
+            self._release(dep)
+        return inputs
+
+    def _compute(self, stage):
+        handle = self.shared.get(stage.key)
+        if handle is not None:
+            with profiling.stage("shm_attach"):
+                image, block = shared_images.attach(handle)
+            self.blocks.append(block)
+            return image
+
+        raw = stage.kind in _RAW_CACHED_KINDS and self.options.get("raw_cache")
+        if raw and not self.options.get("force"):
+            with profiling.stage("raw_load"):
+                result = raw_cache.load(stage.key)
+            if result is not None:
+                # 입력 단계(원본 디코드)는 아예 계산하지 않음
+                return result
+
+        inputs = [self.evaluate(dep) for dep in stage.deps]
+        result = _EXECUTORS[stage.kind](stage.params, inputs, self.options)
+        del inputs
+        for dep in stage.deps:
+            self._release(dep)
+        if raw:
+            with profiling.stage("raw_save"):
+                raw_cache.save(stage.key, result)
+        return result
+
+    def evaluate(self, key):
+        """단계 결과 계산 (한 번 계산한 결과나 예외는 memo 에서 재사용)"""
+        if key not in self.memo:
+            try:
+                self.memo[key] = self._compute(self.stages[key])
+            except Exception as e:
+                self.memo[key] = e
+        result = self.memo[key]
+        if isinstance(result, Exception):
+            raise result
+        if key not in self.consumers:
+            # 최종 출력(encode)은 더 쓰는 곳이 없음
+            del self.memo[key]
+        return result
+
+
+def _error_message(e):
+    return f"{type(e).__name__}: {e}"
+
+
+def _evaluate_target(batch, key):
+    """출력 1개 계산 후 (에러 메시지 또는 None, 소요 시간, encode 결과, 프로파일 레코드)"""
+    if not batch.options.get("profile"):
+        started = time.perf_counter()
+        try:
+            report = batch.evaluate(key)
+        except Exception as e:
+            return _error_message(e), 0.0, None, None
+        return None, time.perf_counter() - started, report, None
+
+    # 같은 배치에서 공유하는 단계(decode, frame)는 처음 계산한 출력의 레코드에만 들어간다
+    error = report = None
+    with profiling.image(path=batch.stages[key].params["path"], pid=os.getpid()) as record:
+        try:
+            report = batch.evaluate(key)
+        except Exception as e:
+            error = _error_message(e)
+    record["error"] = error
+    return error, 0.0 if error else record["wall_ms"] / 1000, report, record
+
+
+def _timed_encode(stage, inputs, options, started):
+    report = _EXECUTORS[stage.kind](stage.params, inputs, options)
+    return report, time.perf_counter() - started
+
+
+def _evaluate_threaded(batch, target_keys, threads):
+    """렌더링은 이 스레드에서 순서대로, encode 는 스레드 풀에서 병렬로
+
+    제출한 encode 가 threads 개가 되면 가장 오래된 것이 끝날 때까지 다음 렌더링을 미룬다.
+    그래서 메모리의 캡션 사본은 인코딩 중 threads 장 + 렌더링 중 1장을 넘지 않는다.
+    """
+    results = {}
+
+    def collect(key, future):
+        try:
+            report, seconds = future.result()
+        except Exception as e:
+            results[key] = (_error_message(e), 0.0, None, None)
+        else:
+            results[key] = (None, seconds, report, None)
+
+    with ThreadPoolExecutor(max_workers=threads) as encoders:
+        inflight = deque()
+        for key in target_keys:
+            started = time.perf_counter()
+            try:
+                inputs = batch.inputs(key)
+            except Exception as e:
+                results[key] = (_error_message(e), 0.0, None, None)
+                continue
+            inflight.append((key, encoders.submit(_timed_encode, batch.stages[key],
+                                                  inputs, batch.options, started)))
+            del inputs
+            # 인코딩을 기다리는 이미지가 스레드 수보다 쌓이지 않게 제한
+            while len(inflight) >= threads:
+                collect(*inflight.popleft())
+        while inflight:
+            collect(*inflight.popleft())
+    return [(key, *results[key]) for key in target_keys]
+
+
+def run_batch(task):
+    """배치 1개 실행 후 ([(encode 키, 에러 메시지 또는 None, 소요 시간, encode 결과,
+    프로파일 레코드), ...], cProfile 통계 파일 경로 또는 None) 반환"""
+    stages, target_keys, options = task
+    batch = _Batch(stages, options)
+    threads = options.get("encode_threads", 1)
+
+    profiler = None
+    if options.get("cprofile"):
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        # 프로파일 레코드는 스레드별로 나눌 수 없으므로 --profile 이면 순서대로 실행
+        if threads > 1 and len(target_keys) > 1 and not options.get("profile"):
+            results = _evaluate_threaded(batch, target_keys, threads)
+        else:
+            results = [(key, *_evaluate_target(batch, key)) for key in target_keys]
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        # 공유 메모리 원본을 가리키는 결과/예외를 버린 뒤 블록을 닫음
+        batch.memo.clear()
+        shared_images.detach(batch.blocks)
+
+    stats_path = None
+    if profiler is not None:
+        # 워커별 통계는 임시 파일로 넘기고 메인 프로세스에서 합친다
+        fd, stats_path = tempfile.mkstemp(suffix=".prof", dir=os.path.dirname(options["cprofile"]))
+        os.close(fd)
+        profiler.dump_stats(stats_path)
+    return results, stats_path
+
+
+def _shared_sources(stages, target_keys, options):
+    """메인 프로세스에서 디코드해 넘길 source 단계 키 목록
+
+    출력에서 거슬러 올라가다 원시 캐시에서 바로 열리는 단계(scale/frame)를 만나면
+    그 아래 원본은 필요 없다.
+    """
+    def cached(stage):
+        return (stage.kind in _RAW_CACHED_KINDS and options.get("raw_cache")
+                and not options.get("force") and os.path.exists(raw_cache.raw_path(stage.key)))
+
+    needed = set()
+    pending = list(target_keys)
+    while pending:
+        key = pending.pop()
+        if key in needed:
+            continue
+        needed.add(key)
+        if not cached(stages[key]):
+            pending.extend(stages[key].deps)
+    return [key for key in needed if stages[key].kind == "source"]
+
+
+def _map_shared(pool, tasks, slots):
+    """원본을 이 프로세스에서 디코드해 공유 메모리 링으로 넘기며 배치 실행
+
+    빈 슬롯이 없으면 먼저 보낸 배치가 끝나 슬롯이 반납될 때까지 기다린다.
+    """
+    ring = shared_images.ImageRing(slots)
+    results = [None] * len(tasks)
+    pending = {}
+
+    def collect(futures):
+        for future in futures:
+            index, used = pending.pop(future)
+            results[index] = future.result()
+            for slot in used:
+                ring.release(slot)
+
+    try:
+        for index, (stages, keys, options) in enumerate(tasks):
+            handles = {}
+            used = []
+            for key in _shared_sources(stages, keys, options):
+                while ring.full() and pending:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                if ring.full():
+                    break
+                try:
+                    image = _run_source(stages[key].params, [], options)
+                except Exception:
+                    continue  # 워커에서 다시 열어 출력별 에러로 기록
+                shared = ring.put(image)
+                del image
+                if shared is not None:
+                    used.append(shared[0])
+                    handles[key] = shared[1]
+            future = pool.submit(run_batch, (stages, keys, dict(options, shared=handles)))
+            pending[future] = (index, used)
+        collect(wait(pending).done)
+    finally:
+        for future in pending:
+            future.cancel()
+        wait(pending)
+        ring.close()
+    print(f"🧠 공유 메모리 최대 {ring.peak_bytes / 1024 ** 2:.1f}MB (슬롯 {ring.slots}개)")
+    return results
+
+
+def _map_batches(pool, tasks, shared_memory):
+    if shared_memory is None:
+        return list(pool.map(run_batch, tasks))
+    return _map_shared(pool, tasks, shared_memory)
+
+
+def add_arguments(parser, jobs=True):
+    """빌드 스크립트 공통 옵션 추가"""
+    parser.add_argument("--spec", default=None, help="빌드 스펙 파일 (기본값: app-store-assets/assets.json)")
+    if jobs:
+        parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="병렬 처리 프로세스 수 (0이면 CPU 코어 수, 기본값 1)")
+    parser.add_argument("--force", action="store_true", help="빌드 캐시를 무시하고 모두 다시 생성")
+    parser.add_argument("--disk-frame-cache", action="store_true",
+                        help="프레임 템플릿을 .build-cache/frames 에 저장해 워커/다음 실행과 공유")
+    parser.add_argument("--no-raw-cache", action="store_false", dest="raw_cache",
+                        help="축소본·프레임 합성본 원시 캐시(.build-cache/raw)를 쓰지 않음")
+    parser.add_argument("--export", action="store_true",
+                        help="스펙의 exports (스토어 규격 크기·WebP 변형)도 생성")
+    if jobs:
+        parser.add_argument("--shared-memory", type=int, nargs="?", const=0, default=None, metavar="SLOTS",
+                            help="원본을 메인 프로세스에서 디코드해 공유 메모리 링으로 워커에 전달 "
+                                 "(SLOTS: 동시에 잡아 둘 원본 수, 기본값 프로세스 수 x 2)")
+    parser.add_argument("--encode-threads", type=int, default=0, metavar="N",
+                        help="배치별 인코딩 스레드 수 (기본값: CPU 코어 수 / 프로세스 수). "
+                             "프로세스마다 전체 해상도 캡션 사본이 최대 N+1 장 메모리에 있음")
+    parser.add_argument("--tiled", type=int, nargs="?", const=tiled.STRIP_HEIGHT, default=None,
+                        metavar="ROWS", dest="strip_height",
+                        help="스크린샷을 ROWS 행 띠 단위로 합성해 바로 저장 (4-8K 캔버스 메모리 절약, "
+                             f"기본값 {tiled.STRIP_HEIGHT})")
+    parser.add_argument("--resize-quality", default=resize.DEFAULT_QUALITY, choices=resize.QUALITY_GAPS,
+                        help="스크린샷/아이콘 축소 품질 (reduce 후 LANCZOS, exact 면 LANCZOS 만, "
+                             f"기본값 {resize.DEFAULT_QUALITY})")
+    parser.add_argument("--report-bytes", action="store_true",
+                        help="포맷별 최적화 옵션으로 줄어든 바이트 수 보고 (기본 옵션으로 한 번 더 인코딩)")
+    parser.add_argument("--watch", action="store_true",
+                        help="원본/스펙이 바뀔 때마다 바뀐 출력만 다시 생성 (Ctrl+C 로 종료)")
+    parser.add_argument("--poll", action="store_true",
+                        help="--watch 에서 파일 알림(watchfiles) 대신 주기적 폴링 사용")
+    parser.add_argument("--profile", default=None, metavar="JSONL",
+                        help="출력별 단계 시간(wall/CPU)·크기·바이트 수를 JSON Lines 로 저장")
+    parser.add_argument("--cprofile", default=None, metavar="PROF",
+                        help="cProfile 통계 저장 (python -m pstats PROF 로 확인)")
+
+
+def add_preview_argument(parser):
+    parser.add_argument("--preview", type=int, nargs="?", const=4, default=None,
+                        choices=PREVIEW_FACTORS, metavar="N",
+                        help="1/N 크기 미리보기만 빠르게 생성 (N: 2, 4, 8, 기본값 4)")
+
+
+def run_options(args):
+    """add_arguments 로 받은 옵션 → run() 키워드 인자"""
+    return dict(jobs=getattr(args, "jobs", 1), force=args.force,
+                disk_frame_cache=args.disk_frame_cache, raw_cache=args.raw_cache,
+                preview=getattr(args, "preview", None), export=args.export,
+                resize_quality=args.resize_quality, strip_height=args.strip_height,
+                shared_memory=getattr(args, "shared_memory", None),
+                encode_threads=args.encode_threads, report_bytes=args.report_bytes,
+                profile=args.profile, cprofile=args.cprofile)
+
+
+def run_from_args(args, spec=None, only=None, kinds=KINDS, locales=None):
+    """add_arguments 로 받은 옵션으로 run() 호출 (스펙 오류는 메시지 출력 후 2 반환)
+
+    spec 은 스펙 dict 또는 스펙을 새로 읽어 오는 함수다. --watch 에서는 변경이 있을
+    때마다 이 함수로 스펙을 다시 읽는다.
+    """
+    load = spec if callable(spec) else (lambda: spec or load_spec(args.spec))
+    try:
+        if args.watch:
+            from .watch import watch
+            return watch(load, only=only, kinds=kinds, locales=locales,
+                         poll=args.poll, **run_options(args))
+        return run(load(), only=only, kinds=kinds, locales=locales, **run_options(args))
+    except (SpecError, OSError) as e:
+        print(f"❌ 스펙 오류: {e}")
+        return 2
+
+
+def _print_bytes_report(reports):
+    """포맷별 출력 바이트와 최적화 옵션으로 줄어든 바이트
+
+    plain_bytes 가 없는 출력(--tiled 띠 렌더링, 전체 캔버스를 다시 인코딩하지 않음)은
+    크기만 따로 합산한다.
+    """
+    totals = {}
+    for fmt, report in reports:
+        count, size, plain, unmeasured = totals.get(fmt, (0, 0, 0, 0))
+        if "plain_bytes" in report:
+            totals[fmt] = (count + 1, size + report["bytes"], plain + report["plain_bytes"], unmeasured)
+        else:
+            totals[fmt] = (count, size, plain, unmeasured + report["bytes"])
+    for fmt, (count, size, plain, unmeasured) in sorted(totals.items()):
+        if count:
+            saved = plain - size
+            print(f"💾 {fmt} {count}개: {size / 1024:,.0f} KB "
+                  f"(최적화로 {saved / 1024:,.0f} KB 절약, {saved / max(plain, 1) * 100:.1f}%)")
+        if unmeasured:
+            print(f"💾 {fmt} 띠 렌더링: {unmeasured / 1024:,.0f} KB (기본 옵션 비교 없음)")
+
+
+def _write_profile(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    print(f"⏱️  프로파일 기록: {path} ({len(records)}개)")
+
+
+def _merge_cprofile(path, parts):
+    if not parts:
+        return
+    stats = pstats.Stats(*parts)
+    stats.dump_stats(path)
+    for part in parts:
+        os.remove(part)
+    print(f"🔬 cProfile 저장: {path} (python -m pstats {path})")
+
+
+def run(spec, only=None, kinds=KINDS, locales=None, jobs=1, force=False,
+        disk_frame_cache=False, raw_cache=True, preview=None, export=False,
+        resize_quality=resize.DEFAULT_QUALITY, strip_height=None, shared_memory=None, encode_threads=0,
+        report_bytes=False, profile=None, cprofile=None, executor=None):
+    """스펙의 오래된 출력만 다시 만들고 종료 코드 반환 (실패가 있으면 1)
+
+    raw_cache: 축소본/프레임 합성본을 .build-cache/raw 에 저장/재사용 (force 면 저장만)
+    resize_quality: 스크린샷/아이콘 2단계 축소 품질 (resize.QUALITY_GAPS)
+    strip_height: 스크린샷을 이 높이의 띠 단위로 렌더링해 바로 저장 (None 이면 전체 캔버스)
+    shared_memory: 원본을 공유 메모리 링으로 워커에 넘길 때 슬롯 수 (0이면 프로세스 수 x 2,
+                   None 이면 워커가 직접 디코드)
+    encode_threads: 배치별 인코딩 스레드 수 (0이면 CPU 코어 수 / 프로세스 수,
+        프로세스마다 전체 해상도 캡션 사본이 최대 encode_threads + 1 장 메모리에 있음)
+    report_bytes: 포맷별 최적화로 줄어든 바이트 수 보고
+    profile: 출력별 단계 시간 JSON Lines 경로, cprofile: cProfile 통계 저장 경로
+    executor: 배치를 보낼 프로세스 풀 (--watch 처럼 워커를 계속 살려 둘 때)
+    """
+    cache = BuildCache(force=force)
+    graph = build_graph(spec, cache, only, kinds, locales, preview, export, resize_quality, strip_height)
+
+    if only:
+        labels = {t.label.split(" [")[0] for t in graph.targets}
+        missing = [name for name in only if name not in labels]
+        if missing:
+            raise SpecError(f"스펙에 없는 항목: {', '.join(missing)}")
+
+    # 다시 만들 출력을 원본별로 묶음 (스펙 순서 유지)
+    stale = [t for t in graph.targets if not cache.is_fresh(t.path, t.key)]
+    batches = {}
+    for target in stale:
+        batches.setdefault(graph.root(target.key), []).append(target.key)
+
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    if encode_threads <= 0:
+        encode_threads = max(1, (os.cpu_count() or 1) // jobs)
+    options = {"disk_frame_cache": disk_frame_cache, "raw_cache": raw_cache, "force": force,
+               "encode_threads": encode_threads,
+               "report_bytes": report_bytes, "profile": bool(profile),
+               "cprofile": os.path.abspath(cprofile) if cprofile else None}
+    tasks = [(graph.closure(keys), keys, options) for keys in batches.values()]
+
+    if shared_memory == 0:
+        shared_memory = jobs * 2
+    if executor is not None and len(tasks) > 1:
+        batch_results = _map_batches(executor, tasks, shared_memory)
+    elif jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            batch_results = _map_batches(pool, tasks, shared_memory)
+    else:
+        batch_results = [run_batch(task) for task in tasks]
+    results = {result[0]: result[1:] for batch, _ in batch_results for result in batch}
+
+    errors = []
+    records = []
+    reports = []
+    for target in stale:
+        error, seconds, report, record = results[target.key]
+        if record is not None:
+            records.append(dict(label=target.label, **record))
+        if report is not None:
+            reports.append((graph.stages[target.key].params["format"], report))
+        if error is None:
+            cache.record(target.path, target.key, seconds)
+            print(f"✅ 생성 완료: {target.path}")
+        else:
+            errors.append((target.label, error))
+
+    cache.save()
+    if raw_cache:
+        prune_raw_cache()
+    glyphs.prune()
+    print(cache.summary())
+    if report_bytes:
+        _print_bytes_report(reports)
+    if profile:
+        _write_profile(profile, records)
+    if cprofile:
+        _merge_cprofile(cprofile, [path for _, path in batch_results])
+
+    if errors:
+        print(f"\n❌ {len(errors)}개 출력 생성 실패:")
+        for label, error in errors:
+            print(f"   - {label}: {error}")
+        return 1
+    return 0
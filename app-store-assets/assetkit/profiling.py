@@ -0,0 +1,54 @@
+"""
+단계별 프로파일링 (opt-in)
+
+profiling.image() 블록 안에서 profiling.stage("resize") 등으로 감싼 구간의
+wall/CPU 시간을 이미지 1장 단위 레코드(dict)에 모은다. 레코드는 파이프라인이
+--profile 경로에 JSON Lines 로 기록한다.
+
+활성화된 레코드가 없으면 stage() 는 아무 것도 하지 않으므로 평소 빌드에는 비용이 없다.
+"""
+
+import time
+from contextlib import contextmanager
+
+_current = None
+
+
+@contextmanager
+def image(**fields):
+    """이미지 1장 레코드 수집 (블록이 끝나면 wall_ms/cpu_ms 가 채워진 dict)"""
+    global _current
+    record = dict(fields, stages={})
+    previous, _current = _current, record
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    finally:
+        _current = previous
+        record["wall_ms"] = round((time.perf_counter() - wall) * 1000, 3)
+        record["cpu_ms"] = round((time.process_time() - cpu) * 1000, 3)
+        for timing in record["stages"].values():
+            timing["wall_ms"] = round(timing["wall_ms"], 3)
+            timing["cpu_ms"] = round(timing["cpu_ms"], 3)
+
+
+@contextmanager
+def stage(name):
+    """현재 레코드에 구간 시간 누적 (레코드가 없으면 no-op)"""
+    record = _current
+    if record is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        timing = record["stages"].setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+        timing["wall_ms"] += (time.perf_counter() - wall) * 1000
+        timing["cpu_ms"] += (time.process_time() - cpu) * 1000
+
+
+def annotate(**fields):
+    """현재 레코드에 이미지 크기/바이트 수 등 기록 (레코드가 없으면 무시)"""
+    if _current is not None:
+        _current.update(fields)
@@ -0,0 +1,114 @@
+"""
+축소본·프레임 합성본(텍스트 없는 중간 결과) 원시 픽셀 캐시
+
+.build-cache/raw/<단계 키>.raw 에 작은 헤더 + 압축 없는 픽셀을 저장하고, 다시 읽을 때는
+mmap + Image.frombuffer 로 파일을 그대로 매핑한다 (디코드/복사 없음).
+캡션 문구나 인코딩 옵션만 바뀐 재빌드는 원본 디코드와 프레임 합성을 건너뛴다.
+
+컬러 픽셀은 RGBX/RGBA(픽셀당 4바이트), L 은 1바이트로 저장한다. Pillow 는 RGB 도 내부적으로
+4바이트로 다루기 때문에 RGB 는 RGBX 로 바꿔야 복사 없이 매핑할 수 있다.
+"""
+
+import mmap
+import os
+import struct
+
+from PIL import Image
+
+from . import CACHE_DIR
+
+RAW_DIR = os.path.join(CACHE_DIR, "raw")
+
+# 오래된 파일부터 지워 이 크기 이하로 유지
+MAX_BYTES = 1024 ** 3
+
+_MAGIC = b"HBRAW1\0\0"
+# magic, 저장 모드(4바이트), width, height
+_HEADER = struct.Struct("<8s4sII")
+
+# 이미지 모드 → 저장 모드 (Pillow 내부 배치와 같은 RGBX/RGBA 4바이트, L 1바이트라 그대로 매핑 가능)
+_RAW_MODES = {"RGB": "RGBX", "RGBX": "RGBX", "RGBA": "RGBA", "L": "L"}
+
+
+def raw_path(key):
+    return os.path.join(RAW_DIR, f"{key}.raw")
+
+
+def save(key, image):
+    """image 를 원시 파일로 저장 (지원하지 않는 모드면 저장하지 않음)"""
+    raw_mode = _RAW_MODES.get(image.mode)
+    if raw_mode is None:
+        return
+    path = raw_path(key)
+    os.makedirs(RAW_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, raw_mode.encode().ljust(4), image.width, image.height))
+        f.write(image.tobytes("raw", raw_mode))
+    os.replace(tmp_path, path)
+
+
+def load(key):
+    """원시 파일을 매핑한 읽기 전용 이미지 (없거나 깨졌으면 None)
+
+    반환된 이미지는 파일을 직접 가리키므로 그리기 전에 copy()/convert() 해야 한다.
+    """
+    path = raw_path(key)
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        return None
+    magic, raw_mode, width, height = _HEADER.unpack_from(mapped)
+    raw_mode = raw_mode.decode(errors="replace").strip()
+    bands = 1 if raw_mode == "L" else 4
+    if magic != _MAGIC or raw_mode not in _RAW_MODES.values() \
+            or len(mapped) != _HEADER.size + width * height * bands:
+        mapped.close()
+        return None
+
+    # 최근에 쓴 파일이 prune() 에서 살아남도록 수정 시각 갱신
+    # (그 사이 다른 빌드의 prune() 이 지웠으면 미적중으로 보고 원본부터 다시 계산)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        mapped.close()
+        return None
+    pixels = memoryview(mapped)[_HEADER.size:]
+    return Image.frombuffer(raw_mode, (width, height), pixels, "raw", raw_mode, 0, 1)
+
+
+def _mtime(entry):
+    try:
+        return entry.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def prune_dir(directory, suffix, max_bytes):
+    """directory 의 suffix 파일을 오래된 것부터 지워 전체 크기를 max_bytes 이하로
+
+    다른 빌드(watch, 데몬, 다른 터미널)가 동시에 지운 파일은 건너뛴다.
+    """
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return
+    entries.sort(key=_mtime, reverse=True)
+    total = 0
+    for entry in entries:
+        try:
+            total += entry.stat().st_size
+            if total > max_bytes:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+
+
+def prune(max_bytes=MAX_BYTES):
+    """오래된 원시 파일부터 지워 전체 크기를 max_bytes 이하로"""
+    prune_dir(RAW_DIR, ".raw", max_bytes)
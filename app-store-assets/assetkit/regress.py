@@ -0,0 +1,130 @@
+"""
+출력 이미지 회귀 검사 (골든 이미지와 비교)
+
+한 쌍 비교 순서 (해시/축소본으로 거르지 않고 전체 픽셀을 비교):
+  1. 파일 바이트가 같으면 바로 identical (디코드 안 함)
+  2. 크기가 다르면 size_mismatch
+  3. 원본 해상도 전체를 NumPy 로 픽셀 비교 (채널 최대 차이가 tolerance 초과면 변경 픽셀)
+     변경 픽셀이 있는 TILE 크기 타일 수는 리포트용으로만 센다
+     (축소본 평균으로 타일을 거르면 1px 이동처럼 타일 안에서 상쇄되는 변경을 놓친다)
+변경이 있으면 골든 이미지 위에 차이를 빨갛게 칠한 heatmap PNG 를 남긴다.
+"""
+
+import filecmp
+import json
+import os
+import shutil
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from . import CACHE_DIR
+
+DEFAULT_REPORT_DIR = os.path.join(CACHE_DIR, "regress")
+
+# 픽셀 채널 차이가 이 값 이하면 같은 것으로 봄 (JPEG 재인코딩 잡음)
+DEFAULT_TOLERANCE = 8
+# 변경 픽셀 비율이 이 값 이하면 통과
+DEFAULT_MAX_CHANGED = 0.0005
+# 축소 비교 타일 크기 (px)
+TILE = 16
+
+# status: identical / within_tolerance / changed / size_mismatch / missing_golden / missing_output
+Result = namedtuple("Result", [
+    "name", "status", "changed_pixels", "changed_ratio", "max_diff",
+    "changed_tiles", "heatmap",
+])
+
+
+def _open_rgb(path):
+    with Image.open(path) as image:
+        return image.convert('RGB')
+
+
+def _diff(new, golden, tolerance):
+    """원본 해상도 비교 → (차이 맵(uint8, 채널 최대), 변경 픽셀 수, 최대 차이, 변경 타일 수)"""
+    a = np.asarray(new)
+    b = np.asarray(golden)
+    diff = np.maximum(a, b) - np.minimum(a, b)
+    # max(axis=2) 보다 채널별 maximum 이 훨씬 빠르다
+    diff_map = np.maximum(np.maximum(diff[..., 0], diff[..., 1]), diff[..., 2])
+    changed_mask = diff_map > tolerance
+    # 변경 픽셀이 하나라도 있는 타일 수 (리포트용)
+    rows, cols = -(-new.height // TILE), -(-new.width // TILE)
+    padded = np.zeros((rows * TILE, cols * TILE), dtype=bool)
+    padded[:new.height, :new.width] = changed_mask
+    tiles = int(padded.reshape(rows, TILE, cols, TILE).any(axis=(1, 3)).sum())
+    return diff_map, int(changed_mask.sum()), int(diff_map.max()), tiles
+
+
+def _write_heatmap(golden, diff_map, tolerance, path):
+    """골든 이미지를 흐리게 깔고 변경 픽셀을 차이 크기만큼 빨갛게"""
+    base = np.asarray(golden.convert('L'), dtype=np.float32)[..., None] * 0.35 + 160
+    heat = np.repeat(base, 3, axis=2)
+    strength = np.clip(diff_map.astype(np.float32) / 64, 0, 1)[..., None]
+    strength[diff_map <= tolerance] = 0
+    heat = heat * (1 - strength) + np.array([255, 0, 0], dtype=np.float32) * strength
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.fromarray(heat.astype(np.uint8), 'RGB').save(path, 'PNG', compress_level=1)
+
+
+def compare(name, new_path, golden_path, report_dir=DEFAULT_REPORT_DIR,
+            tolerance=DEFAULT_TOLERANCE, max_changed=DEFAULT_MAX_CHANGED):
+    """이미지 한 쌍 비교 결과 (Result)"""
+    if not os.path.exists(golden_path):
+        return Result(name, "missing_golden", 0, 0.0, 0, 0, None)
+    if not os.path.exists(new_path):
+        return Result(name, "missing_output", 0, 0.0, 0, 0, None)
+    if filecmp.cmp(new_path, golden_path, shallow=False):
+        return Result(name, "identical", 0, 0.0, 0, 0, None)
+
+    new = _open_rgb(new_path)
+    golden = _open_rgb(golden_path)
+    if new.size != golden.size:
+        return Result(name, "size_mismatch", 0, 1.0, 255, 0, None)
+
+    diff_map, changed, max_diff, tiles = _diff(new, golden, tolerance)
+    ratio = changed / (new.width * new.height)
+    if changed == 0:
+        status = "identical" if max_diff == 0 else "within_tolerance"
+    elif ratio <= max_changed:
+        status = "within_tolerance"
+    else:
+        status = "changed"
+
+    heatmap = None
+    if changed:
+        heatmap = os.path.join(report_dir, name + ".diff.png")
+        _write_heatmap(golden, diff_map, tolerance, heatmap)
+    return Result(name, status, changed, round(ratio, 6), max_diff, tiles, heatmap)
+
+
+def check(pairs, report_dir=DEFAULT_REPORT_DIR, tolerance=DEFAULT_TOLERANCE,
+          max_changed=DEFAULT_MAX_CHANGED, jobs=None):
+    """[(이름, 새 출력, 골든)] 를 스레드 풀로 비교하고 summary.json 저장 후 결과 목록 반환"""
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        results = list(pool.map(lambda pair: compare(*pair, report_dir, tolerance, max_changed), pairs))
+
+    os.makedirs(report_dir, exist_ok=True)
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    with open(os.path.join(report_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump({"tolerance": tolerance, "max_changed": max_changed, "counts": counts,
+                   "results": [result._asdict() for result in results]},
+                  f, ensure_ascii=False, indent=2)
+    return results
+
+
+def update_golden(pairs):
+    """현재 출력을 골든 이미지로 복사"""
+    for _, new_path, golden_path in pairs:
+        if os.path.exists(new_path):
+            os.makedirs(os.path.dirname(golden_path), exist_ok=True)
+            shutil.copy2(new_path, golden_path)
+
+
+def is_failure(result):
+    return result.status in ("changed", "size_mismatch", "missing_golden", "missing_output")
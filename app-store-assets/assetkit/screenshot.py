@@ -0,0 +1,132 @@
+"""
+스토어 스크린샷 렌더러 (프레임 합성 + 캡션)
+
+add_marketing_text.py / update_first_screenshot.py / 파이프라인이 함께 쓴다.
+  - compose_frame: 스크린샷을 프레임 템플릿에 넣은 텍스트 없는 합성본
+    (scale_screen 으로 스크린 크기 축소 → frame_screen 으로 템플릿에 붙이기)
+  - layout_caption / draw_caption: 합성본 위에 제목/부제목 배치 후 그리기
+    (줄별 글자 마스크는 glyphs 캐시에서 꺼내 캡션 전체를 paste 한 번으로 칠함)
+
+각 구간은 profiling.stage 로 감싸져 있어 --profile 로 단계별 시간을 볼 수 있다.
+"""
+
+from collections import namedtuple
+
+from PIL import Image
+
+from . import glyphs, profiling, resize
+from .fonts import BOLD, SEMIBOLD, korean_font, text_width
+from .frame import DEFAULT_STYLE, frame_template, screen_box
+from .layout import wrap_text
+
+CaptionStyle = namedtuple("CaptionStyle", [
+    "title_size",            # 제목 폰트 크기
+    "subtitle_size",         # 부제목 폰트 크기
+    "font_indexes",          # 시도할 AppleSDGothicNeo index (SemiBold -> Bold)
+    "color",                 # 텍스트 색
+    "text_top",              # 텍스트 시작 y
+    "title_line_height",     # 제목 줄 간격
+    "subtitle_line_height",  # 부제목 줄 간격
+    "title_gap",             # 제목과 부제목 사이 여백
+    "min_margin",            # 좌우 최소 여백
+    "line_breaking",         # 줄바꿈 방식 ("greedy" / "balanced", layout.wrap_text)
+], defaults=("greedy",))
+
+# 혼밥노노 기본 캡션 스타일
+DEFAULT_CAPTION = CaptionStyle(
+    title_size=64,
+    subtitle_size=42,
+    font_indexes=(SEMIBOLD, BOLD),
+    color=(80, 60, 40),  # 어두운 브라운
+    text_top=55,
+    title_line_height=72,
+    subtitle_line_height=52,
+    title_gap=30,
+    min_margin=20,
+    line_breaking="balanced",
+)
+
+
+# 미리보기 축소 시 함께 줄이는 길이 값
+_LENGTH_FIELDS = ("title_size", "subtitle_size", "text_top", "title_line_height",
+                  "subtitle_line_height", "title_gap", "min_margin")
+
+
+def scaled_caption(style, scale):
+    """폰트 크기와 간격만 scale 배로 줄인 캡션 스타일 (미리보기용)"""
+    return style._replace(**{field: max(1, round(getattr(style, field) * scale))
+                             for field in _LENGTH_FIELDS})
+
+
+def scale_screen(img, style=DEFAULT_STYLE, resample=Image.Resampling.LANCZOS,
+                 quality=resize.DEFAULT_QUALITY):
+    """스크린샷을 프레임 스크린 영역 크기로 줄인 이미지 (resize 의 2단계 축소)"""
+    with profiling.stage("resize"):
+        return resize.resize(img, screen_box(img.width, img.height, style)[2:], resample, quality)
+
+
+def frame_screen(screen_img, size, style=DEFAULT_STYLE, disk_cache=False):
+    """scale_screen 결과를 size(원본 스크린샷 크기) 프레임 템플릿에 붙인 RGB 합성본"""
+    # 배경/그림자/스마트폰 프레임은 기기 크기별 캐시된 템플릿을 복사해서 사용
+    with profiling.stage("composite"):
+        template = frame_template(size[0], size[1], style, disk_cache=disk_cache)
+        frame = template.canvas.copy()
+    with profiling.stage("paste"):
+        frame.paste(screen_img, template.screen_box[:2], template.screen_mask)
+    return frame
+
+
+def compose_frame(img, style=DEFAULT_STYLE, disk_cache=False, resample=Image.Resampling.LANCZOS,
+                  quality=resize.DEFAULT_QUALITY):
+    """스크린샷을 프레임 템플릿에 붙인 텍스트 없는 RGB 합성본 반환"""
+    return frame_screen(scale_screen(img, style, resample, quality), img.size, style, disk_cache)
+
+
+def layout_caption(frame_width, title, subtitle, style=DEFAULT_CAPTION):
+    """제목/부제목 줄 배치 [((x, y), 줄 텍스트, 폰트), ...] 반환
+
+    제목과 부제목 모두 좌우 여백 안에 들어가도록 줄바꿈하고 ('\n' 은 강제 줄바꿈)
+    줄마다 가운데 정렬한다.
+    """
+    margin = style.min_margin
+    max_width = frame_width - margin * 2
+    title_font = korean_font(style.title_size, tuple(style.font_indexes))
+    subtitle_font = korean_font(style.subtitle_size, tuple(style.font_indexes))
+    runs = []
+
+    # 제목 텍스트 (너무 길면 자동으로 줄바꿈)
+    lines = wrap_text(title, title_font, max_width, style.line_breaking)
+    for i, line in enumerate(lines):
+        line_x = max(margin, (frame_width - text_width(title_font, line)) // 2)
+        line_y = style.text_top + i * style.title_line_height
+        runs.append(((line_x, line_y), line, title_font))
+
+    # 부제목 텍스트 (제목 바로 아래)
+    subtitle_y_start = style.text_top + len(lines) * style.title_line_height + style.title_gap
+    for i, line in enumerate(wrap_text(subtitle, subtitle_font, max_width, style.line_breaking)):
+        line_x = max(margin, (frame_width - text_width(subtitle_font, line)) // 2)
+        line_y = subtitle_y_start + i * style.subtitle_line_height
+        runs.append(((line_x, line_y), line, subtitle_font))
+    return runs
+
+
+def draw_caption(frame, title, subtitle, style=DEFAULT_CAPTION, disk_cache=False):
+    """프레임 상단에 제목/부제목을 가운데 정렬로 그림 (frame을 직접 수정)
+
+    disk_cache=True 면 줄 마스크를 .build-cache/glyphs 에 남겨 다음 실행에서도 재사용
+    """
+    with profiling.stage("text_layout"):
+        runs = layout_caption(frame.width, title, subtitle, style)
+    with profiling.stage("text_draw"):
+        caption = glyphs.runs_mask(runs, disk_cache)
+        if caption is not None:
+            box, mask = caption
+            frame.paste(tuple(style.color), box, mask)
+    return frame
+
+
+def render_screenshot(img, title, subtitle, frame_style=DEFAULT_STYLE,
+                      caption_style=DEFAULT_CAPTION, disk_cache=False):
+    """프레임 합성 + 캡션까지 끝난 RGB 이미지 반환"""
+    frame = compose_frame(img, frame_style, disk_cache)
+    return draw_caption(frame, title, subtitle, caption_style, disk_cache)
@@ -0,0 +1,108 @@
+"""
+공유 메모리로 디코드한 원본 넘기기 (--shared-memory)
+
+메인 프로세스가 원본을 디코드해서 multiprocessing.shared_memory 블록에 원시 픽셀로
+쓰고, 워커에는 블록 이름/모드/크기(SharedImage)만 보낸다. 워커는 블록을 붙여서
+Image.frombuffer 로 복사 없이 연다. 수 메가픽셀 이미지를 pickle 로 보내지 않는다.
+
+블록은 고정 개수(slots)의 링으로 돌려 쓴다. 빈 슬롯이 없으면 앞선 배치가 끝날 때까지
+기다리므로 기기 크기/로케일이 많아도 공유 메모리는 slots × 가장 큰 원본 이하로 유지된다.
+
+픽셀 형식은 raw_cache 와 같이 RGB 를 RGBX 로 저장한다 (4바이트 모드만 복사 없이 매핑).
+"""
+
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+from PIL import Image
+
+# 이미지 모드 → 공유 메모리 픽셀 모드
+_SHARED_MODES = {"RGB": "RGBX", "RGBX": "RGBX", "RGBA": "RGBA", "L": "L"}
+
+# 워커로 보내는 핸들 (pickle 가능)
+SharedImage = namedtuple("SharedImage", ["name", "mode", "size"])
+
+
+def _nbytes(mode, size):
+    return size[0] * size[1] * (1 if mode == "L" else 4)
+
+
+class ImageRing:
+    """메인 프로세스 쪽 공유 메모리 블록 링 (블록은 최대 slots 개)"""
+
+    def __init__(self, slots):
+        self.slots = max(1, slots)
+        self.blocks = []
+        self.free = []
+        self.peak_bytes = 0
+        # 워커가 블록을 붙일 때 등록하는 resource tracker 를 메인과 같은 것으로 맞춤
+        # (워커가 따로 띄운 tracker 가 종료 시 블록을 지우지 않도록 풀 생성 전에 시작)
+        resource_tracker.ensure_running()
+
+    def full(self):
+        return not self.free and len(self.blocks) >= self.slots
+
+    def put(self, image):
+        """빈 슬롯에 이미지를 쓰고 (슬롯 번호, SharedImage) 반환
+
+        공유할 수 없는 모드면 None. 빈 슬롯이 없으면 IndexError (full() 을 먼저 확인).
+        """
+        mode = _SHARED_MODES.get(image.mode)
+        if mode is None:
+            return None
+        nbytes = _nbytes(mode, image.size)
+        if self.free:
+            # 크기가 맞는 빈 블록 중 가장 작은 것, 없으면 가장 큰 빈 블록을 다시 만듦
+            fitting = [slot for slot in self.free if self.blocks[slot].size >= nbytes]
+            if fitting:
+                slot = min(fitting, key=lambda slot: self.blocks[slot].size)
+            else:
+                slot = max(self.free, key=lambda slot: self.blocks[slot].size)
+                self._unlink(self.blocks[slot])
+                self.blocks[slot] = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.free.remove(slot)
+        elif len(self.blocks) < self.slots:
+            slot = len(self.blocks)
+            self.blocks.append(shared_memory.SharedMemory(create=True, size=nbytes))
+        else:
+            raise IndexError("공유 메모리 링에 빈 슬롯이 없습니다")
+
+        block = self.blocks[slot]
+        block.buf[:nbytes] = image.tobytes("raw", mode)
+        self.peak_bytes = max(self.peak_bytes, sum(b.size for b in self.blocks))
+        return slot, SharedImage(block.name, mode, image.size)
+
+    def release(self, slot):
+        """워커가 다 쓴 슬롯 반납"""
+        self.free.append(slot)
+
+    @staticmethod
+    def _unlink(block):
+        block.close()
+        block.unlink()
+
+    def close(self):
+        for block in self.blocks:
+            self._unlink(block)
+        self.blocks = []
+        self.free = []
+
+
+def attach(handle):
+    """워커에서 블록을 붙여 (읽기 전용 이미지, SharedMemory) 반환
+
+    이미지가 블록 메모리를 직접 가리키므로 이미지를 다 쓴 뒤에 블록을 close() 한다.
+    """
+    block = shared_memory.SharedMemory(name=handle.name)
+    pixels = block.buf[:_nbytes(handle.mode, handle.size)]
+    image = Image.frombuffer(handle.mode, handle.size, pixels, "raw", handle.mode, 0, 1)
+    return image, block
+
+
+def detach(blocks):
+    """attach 한 블록들 닫기 (아직 이미지가 참조 중이면 남겨 둠)"""
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass
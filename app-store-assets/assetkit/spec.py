@@ -0,0 +1,231 @@
+"""
+에셋 빌드 스펙(assets.json) 로딩
+
+스펙 하나에 입력 파일, 로케일별 캡션, 폰트 크기, 프레임 지오메트리, 출력 포맷을
+모두 적고, 스크린샷/그래픽마다 frame·caption·outputs·exports 를 덮어쓸 수 있다.
+exports 는 스토어 규격 크기/포맷 변형으로 --export 를 줄 때만 만든다.
+defaults.export_encode 의 포맷별 기본 save() 옵션(progressive/optimize/method)은 exports 에만
+적용한다. outputs 는 출력에 적은 옵션 그대로 저장하므로 기존 결과(골든 이미지) 바이트가 바뀌지 않는다.
+상대 경로는 스펙 파일이 있는 폴더 기준이다. (.yaml/.yml 은 PyYAML 이 있을 때만)
+"""
+
+import copy
+import json
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+
+from . import ASSETS_DIR
+from .frame import FrameStyle
+from .screenshot import CaptionStyle
+
+DEFAULT_SPEC_PATH = os.path.join(ASSETS_DIR, "assets.json")
+
+# 출력 1개 (경로, Pillow 포맷, save() 옵션, 규격 크기, 맞춤 방식, 여백 색)
+#   size 가 없으면 렌더링 원본 크기 그대로
+#   fit "pad": 원본 비율로 size 안에 줄인 뒤 여백을 채워 정확히 size 로 (기본값)
+#   fit "contain": size 안에 들어가게 줄이기만 함
+OutputSpec = namedtuple("OutputSpec", ["path", "format", "options", "size", "fit", "background"],
+                        defaults=(None, "pad", None))
+
+# 포맷별로 허용하는 save() 옵션 (PNG 의 quality 처럼 조용히 무시되는 옵션은 스펙 오류로)
+ENCODE_OPTIONS = {
+    "JPEG": ("quality", "optimize", "progressive", "subsampling", "dpi"),
+    "PNG": ("optimize", "compress_level", "dpi"),
+    "WEBP": ("quality", "method", "lossless"),
+}
+
+FITS = ("pad", "contain")
+
+# 스크린샷 x 로케일 1개
+ScreenshotEntry = namedtuple("ScreenshotEntry", [
+    "name", "locale", "input_path", "title", "subtitle",
+    "frame_style", "caption_style", "outputs", "exports",
+])
+
+# Feature Graphic 1개 (kind: "text" 또는 "icon")
+GraphicEntry = namedtuple("GraphicEntry", ["name", "kind", "icon_path", "params", "outputs", "exports"])
+
+
+class SpecError(ValueError):
+    """스펙 형식 오류"""
+
+
+@contextmanager
+def _entry(where):
+    """항목을 읽다 빠진 키/잘못된 모양이 나오면 어느 항목인지 붙여 SpecError 로"""
+    try:
+        yield
+    except KeyError as e:
+        raise SpecError(f"{where}: 필수 항목 {e} 가 없습니다") from None
+    except (IndexError, TypeError, AttributeError) as e:
+        raise SpecError(f"{where}: 형식 오류 ({e})") from None
+
+
+def load_spec(path=None):
+    """스펙 파일을 읽어 dict로 반환 (경로 해석 기준 폴더를 _base_dir 에 기록)"""
+    path = os.path.abspath(path or DEFAULT_SPEC_PATH)
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SpecError(f"YAML 스펙을 읽으려면 PyYAML 이 필요합니다: {path}")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise SpecError(f"스펙 최상위는 객체여야 합니다: {path}")
+    spec["_base_dir"] = os.path.dirname(path)
+    spec["_path"] = path
+    return spec
+
+
+def resolve_path(spec, path):
+    return os.path.normpath(os.path.join(spec["_base_dir"], path))
+
+
+def _tuplify(value):
+    """JSON 리스트를 해시 가능한 튜플로 (프레임 템플릿 LRU 키로 쓰임)"""
+    if isinstance(value, list):
+        return tuple(_tuplify(v) for v in value)
+    return value
+
+
+def _merged(defaults, overrides):
+    merged = dict(defaults or {})
+    merged.update(overrides or {})
+    return merged
+
+
+def _make(cls, values, where):
+    try:
+        return cls(**{k: _tuplify(v) for k, v in values.items()})
+    except TypeError as e:
+        raise SpecError(f"{where}: {e}")
+
+
+def frame_style(spec, overrides=None):
+    return _make(FrameStyle, _merged(spec.get("defaults", {}).get("frame"), overrides), "frame")
+
+
+def caption_style(spec, overrides=None):
+    return _make(CaptionStyle, _merged(spec.get("defaults", {}).get("caption"), overrides), "caption")
+
+
+def _output(spec, output, base_dir, fields, export):
+    if "path" not in output:
+        raise SpecError(f"출력에 path 가 없습니다: {output}")
+    try:
+        path = output["path"].format(**fields)
+    except (KeyError, IndexError, ValueError) as e:
+        raise SpecError(f"{output['path']}: 쓸 수 없는 자리표시자 {e} "
+                        f"(가능: {', '.join('{' + name + '}' for name in fields)})") from None
+    fmt = output.get("format", "PNG").upper()
+    if fmt not in ENCODE_OPTIONS:
+        raise SpecError(f"{path}: 지원하지 않는 출력 포맷: {fmt}")
+
+    # exports 는 포맷 기본 옵션(defaults.export_encode) 위에 출력별 옵션을 덮어씀
+    options = dict(spec.get("defaults", {}).get("export_encode", {}).get(fmt, {})) if export else {}
+    options.update(output.get("options", {}))
+    unknown = sorted(set(options) - set(ENCODE_OPTIONS[fmt]))
+    if unknown:
+        raise SpecError(f"{path}: {fmt} 에서 쓸 수 없는 옵션: {', '.join(unknown)}")
+
+    size = output.get("size")
+    if size is not None and (len(size) != 2 or min(size) < 1):
+        raise SpecError(f"{path}: size 는 [width, height] 여야 합니다: {size}")
+    fit = output.get("fit", "pad")
+    if fit not in FITS:
+        raise SpecError(f"{path}: 알 수 없는 fit: {fit}")
+    return OutputSpec(os.path.normpath(os.path.join(base_dir, path)), fmt, options,
+                      _tuplify(size), fit, _tuplify(output.get("background")))
+
+
+def _outputs(spec, outputs, base_dir, export=False, **fields):
+    return [_output(spec, output, base_dir, fields, export) for output in outputs]
+
+
+def locale_output_dir(spec, locale):
+    """기본 로케일은 output_dir, 나머지는 output_dir/<locale>"""
+    shots = spec["screenshots"]
+    output_dir = resolve_path(spec, shots["output_dir"])
+    if locale == shots.get("default_locale", locale):
+        return output_dir
+    return os.path.join(output_dir, locale)
+
+
+def screenshot_entries(spec, only=None, locales=None):
+    """스펙의 스크린샷 x 로케일 목록 (캡션이 없는 로케일은 건너뜀)"""
+    shots = spec.get("screenshots")
+    if not shots:
+        return []
+    locales = list(locales or shots.get("locales") or [shots.get("default_locale", "ko")])
+    with _entry("screenshots"):
+        input_dir = resolve_path(spec, shots["input_dir"])
+        output_dirs = {locale: locale_output_dir(spec, locale) for locale in locales}
+    default_outputs = spec.get("defaults", {}).get("outputs", [])
+    default_exports = spec.get("defaults", {}).get("exports", [])
+
+    entries = []
+    for index, item in enumerate(shots.get("items", [])):
+        with _entry(f"screenshots.items[{index}]"):
+            name = item["file"]
+        if only and name not in only:
+            continue
+        stem = os.path.splitext(name)[0]
+        for locale in locales:
+            caption = item.get("captions", {}).get(locale)
+            if caption is None:
+                continue
+            with _entry(f"screenshots.items[{index}] ({name}, {locale})"):
+                entries.append(ScreenshotEntry(
+                    name=name,
+                    locale=locale,
+                    input_path=os.path.join(input_dir, name),
+                    title=caption["title"],
+                    subtitle=caption.get("subtitle", ""),
+                    frame_style=frame_style(spec, item.get("frame")),
+                    caption_style=caption_style(spec, item.get("caption")),
+                    outputs=_outputs(spec, item.get("outputs", default_outputs), output_dirs[locale],
+                                     name=name, stem=stem, locale=locale),
+                    exports=_outputs(spec, item.get("exports", default_exports), output_dirs[locale],
+                                     export=True, name=name, stem=stem, locale=locale),
+                ))
+    return entries
+
+
+def graphic_entries(spec, only=None):
+    """스펙의 Feature Graphic 목록"""
+    entries = []
+    for index, item in enumerate(spec.get("feature_graphics", [])):
+        with _entry(f"feature_graphics[{index}]"):
+            name = item["name"]
+        if only and name not in only:
+            continue
+        kind = item.get("type", "text")
+        if kind not in ("text", "icon"):
+            raise SpecError(f"알 수 없는 feature graphic type: {kind}")
+        icon = item.get("icon")
+        with _entry(f"feature_graphics[{index}] ({name})"):
+            entries.append(GraphicEntry(
+                name=name,
+                kind=kind,
+                icon_path=resolve_path(spec, icon) if icon else None,
+                params=copy.deepcopy(item.get("params", {})),
+                outputs=_outputs(spec, item["outputs"], spec["_base_dir"], name=name),
+                exports=_outputs(spec, item.get("exports", []), spec["_base_dir"], export=True,
+                                 name=name),
+            ))
+    return entries
+
+
+def icon_paths(spec):
+    """icon Feature Graphic 들이 쓰는 아이콘 절대 경로 목록 (중복 제거, 스펙 순서)"""
+    paths = []
+    for item in spec.get("feature_graphics", []):
+        if item.get("icon"):
+            path = resolve_path(spec, item["icon"])
+            if path not in paths:
+                paths.append(path)
+    return paths
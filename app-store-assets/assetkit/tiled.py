@@ -0,0 +1,203 @@
+"""
+가로 띠(strip) 단위 스크린샷 렌더링 (태블릿/인쇄용 4-8K 캔버스)
+
+전체 캔버스를 만들지 않고 strip_height 행씩 배경 → 그림자 → 베젤 → 스크린샷 → 캡션을
+합성해서 바로 인코더로 흘려보낸다. 메모리에는 원본과 띠 1개만 남는다.
+  - 둥근 사각형/마스크는 띠 좌표로 옮겨 그린다 (정수 평행이동이라 전체 캔버스와 같은 픽셀)
+  - 캡션은 glyphs 캐시의 합친 마스크 중 띠에 걸친 행만 잘라 붙인다
+  - 스크린샷 축소는 Image.resize 의 box 로 띠에 해당하는 원본 범위만 계산한다
+    (box 밖 원본 픽셀도 필터에 쓰므로 이음매가 없다. 좌표 반올림 때문에 전체 resize 와
+    픽셀 값이 1 정도 다를 수 있다)
+  - PNG: 띠마다 Up 필터 + zlib 으로 IDAT 청크를 바로 씀 (진짜 스트리밍)
+  - JPEG/WebP: Pillow 인코더는 띠 단위 입력을 받지 않으므로 출력 옆 임시 파일에 RGBX 로
+    쓰고 mmap 한 이미지를 인코딩한다 (파일 페이지라 메모리에 붙잡혀 있지 않음)
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from . import glyphs, profiling
+from .frame import DEFAULT_STYLE, screen_box
+from .screenshot import DEFAULT_CAPTION, layout_caption
+
+STRIP_HEIGHT = 256
+
+
+def canvas_size(size, style=DEFAULT_STYLE):
+    """스크린샷 크기 size 의 프레임 캔버스 크기"""
+    return (size[0] + style.margin_x * 2, size[1] + style.margin_top + style.margin_bottom)
+
+
+def _fill_rounded(strip, y0, box, radius, color):
+    """frame._fill_rounded 를 띠(캔버스 y0 행부터) 좌표로"""
+    left, top, right, bottom = box
+    top, bottom = top - y0, bottom - y0
+    if bottom < 0 or top >= strip.height:
+        return
+    if len(color) < 4 or color[3] == 255:
+        ImageDraw.Draw(strip).rounded_rectangle([left, top, right, bottom], radius=radius,
+                                                fill=tuple(color[:3]))
+        return
+    mask = Image.new('L', (right - left + 1, strip.height), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, top, right - left, bottom], radius=radius, fill=color[3])
+    strip.paste(tuple(color[:3]), (left, 0, right + 1, strip.height), mask)
+
+
+def _paste_screen(strip, y0, img, style, resample):
+    """스크린샷 중 이 띠에 걸친 행만 축소해서 둥근 스크린 마스크로 붙임"""
+    screen_x, screen_y, screen_width, screen_height = screen_box(img.width, img.height, style)
+    top = max(y0, screen_y)
+    bottom = min(y0 + strip.height, screen_y + screen_height)
+    if top >= bottom:
+        return
+    scale = img.height / screen_height
+    with profiling.stage("resize"):
+        rows = img.resize((screen_width, bottom - top), resample,
+                          box=(0, (top - screen_y) * scale, img.width, (bottom - screen_y) * scale))
+    with profiling.stage("paste"):
+        mask = Image.new('L', rows.size, 0)
+        ImageDraw.Draw(mask).rounded_rectangle(
+            [0, screen_y - top, screen_width, screen_y - top + screen_height],
+            radius=style.screen_radius, fill=255)
+        strip.paste(rows, (screen_x, top - y0), mask)
+
+
+def render_strips(img, title, subtitle, frame_style=DEFAULT_STYLE, caption_style=DEFAULT_CAPTION,
+                  strip_height=STRIP_HEIGHT, resample=Image.Resampling.LANCZOS, disk_cache=False):
+    """screenshot.render_screenshot 결과를 위에서부터 (y, RGB 띠) 로 내보내는 제너레이터
+
+    disk_cache=True 면 캡션 줄 마스크를 .build-cache/glyphs 에 남겨 재사용
+    """
+    width, height = canvas_size(img.size, frame_style)
+    style = frame_style
+    phone = (style.margin_x, style.margin_top, style.margin_x + img.width, style.margin_top + img.height)
+    offset = style.shadow_offset
+    shadow = (phone[0] + offset, phone[1] + offset, phone[2] + offset, phone[3] + offset)
+
+    with profiling.stage("text_layout"):
+        runs = layout_caption(width, title, subtitle, caption_style)
+    with profiling.stage("text_draw"):
+        caption = glyphs.runs_mask(runs, disk_cache)
+    color = tuple(caption_style.color)
+
+    for y0 in range(0, height, strip_height):
+        with profiling.stage("composite"):
+            strip = Image.new('RGB', (width, min(strip_height, height - y0)), style.background)
+            _fill_rounded(strip, y0, shadow, style.phone_radius, style.shadow)
+            _fill_rounded(strip, y0, phone, style.phone_radius, style.bezel)
+        _paste_screen(strip, y0, img, style, resample)
+        if caption is not None:
+            (left, top, right, bottom), mask = caption
+            rows = (max(top, y0), min(bottom, y0 + strip.height))
+            if rows[0] < rows[1]:
+                with profiling.stage("text_draw"):
+                    strip.paste(color, (left, rows[0] - y0, right, rows[1] - y0),
+                                mask.crop((0, rows[0] - top, mask.width, rows[1] - top)))
+        yield y0, strip
+
+
+def _chunk(f, kind, data):
+    f.write(struct.pack(">I", len(data)) + kind + data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+class PngStripWriter:
+    """RGB 띠를 받는 대로 IDAT 청크로 쓰는 PNG 인코더 (행 필터는 Up 고정)"""
+
+    def __init__(self, f, size, compress_level=6, dpi=None):
+        self.f = f
+        self.width, self.height = size
+        self.rows = 0
+        self.previous = np.zeros(self.width * 3, dtype=np.uint8)
+        self.compressor = zlib.compressobj(compress_level)
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _chunk(f, b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0))
+        if dpi:
+            # 인치당 픽셀 → 미터당 픽셀
+            _chunk(f, b"pHYs", struct.pack(">IIB", round(dpi[0] / 0.0254), round(dpi[1] / 0.0254), 1))
+
+    def write(self, strip):
+        rows = np.asarray(strip, dtype=np.uint8).reshape(strip.height, self.width * 3)
+        above = np.vstack([self.previous[None, :], rows[:-1]])
+        filtered = np.empty((strip.height, self.width * 3 + 1), dtype=np.uint8)
+        filtered[:, 0] = 2  # Up
+        filtered[:, 1:] = rows - above  # uint8 이라 mod 256
+        self.previous = rows[-1].copy()
+        self.rows += strip.height
+        data = self.compressor.compress(filtered.tobytes())
+        if data:
+            _chunk(self.f, b"IDAT", data)
+
+    def close(self):
+        if self.rows != self.height:
+            raise ValueError(f"PNG 행 수가 맞지 않습니다: {self.rows}/{self.height}")
+        _chunk(self.f, b"IDAT", self.compressor.flush())
+        _chunk(self.f, b"IEND", b"")
+
+
+def _save_png(strips, size, path, options):
+    level = 9 if options.get("optimize") else options.get("compress_level", 6)
+    with open(path, "wb") as f:
+        writer = PngStripWriter(f, size, level, options.get("dpi"))
+        for _, strip in strips:
+            with profiling.stage("encode"):
+                writer.write(strip)
+        writer.close()
+
+
+def _encode_mapped(mapped, size, path, fmt, options):
+    image = Image.frombuffer("RGBX", size, mapped, "raw", "RGBX", 0, 1)
+    try:
+        image.save(path, fmt, **options)
+    finally:
+        image.close()
+
+
+def _save_mapped(strips, size, path, fmt, options):
+    """띠를 임시 파일(RGBX)에 쌓고 mmap 한 이미지를 Pillow 로 인코딩"""
+    width, height = size
+    tmp_path = f"{path}.{os.getpid()}.strips"
+    try:
+        with open(tmp_path, "w+b") as f:
+            f.truncate(width * height * 4)
+            mapped = mmap.mmap(f.fileno(), 0)
+            try:
+                for y0, strip in strips:
+                    start = y0 * width * 4
+                    mapped[start:start + strip.width * strip.height * 4] = strip.tobytes("raw", "RGBX")
+                with profiling.stage("encode"):
+                    _encode_mapped(mapped, size, path, fmt, options)
+            finally:
+                try:
+                    mapped.close()
+                except BufferError:
+                    # 인코딩 예외의 traceback 이 아직 이미지를 붙잡고 있음: 원래 예외가 보이도록
+                    # 닫기는 GC 에 맡긴다 (임시 파일은 아래에서 지우므로 남지 않음)
+                    pass
+    finally:
+        os.remove(tmp_path)
+
+
+def save_strips(strips, size, path, fmt="PNG", options=None):
+    """render_strips 결과를 path 에 저장하고 파일 크기 반환"""
+    options = dict(options or {})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if fmt == "PNG":
+        _save_png(strips, size, path, options)
+    else:
+        _save_mapped(strips, size, path, fmt, options)
+    return os.path.getsize(path)
+
+
+def render_to_file(img, path, title, subtitle, frame_style=DEFAULT_STYLE,
+                   caption_style=DEFAULT_CAPTION, fmt="PNG", options=None,
+                   strip_height=STRIP_HEIGHT, resample=Image.Resampling.LANCZOS, disk_cache=False):
+    """띠 단위로 렌더링해서 바로 저장 (파일 크기 반환)"""
+    strips = render_strips(img, title, subtitle, frame_style, caption_style, strip_height, resample,
+                           disk_cache)
+    return save_strips(strips, canvas_size(img.size, frame_style), path, fmt, options)
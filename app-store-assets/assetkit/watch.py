@@ -0,0 +1,205 @@
+"""
+--watch 모드: 원본 스크린샷/스펙/아이콘이 바뀌면 바뀐 출력만 다시 생성
+
+  - 파일 알림: watchfiles 가 설치돼 있으면 사용, 없으면 (또는 --poll) 주기적 폴링
+  - 디바운스: 연달아 들어온 변경은 잠잠해질 때까지 모아서 한 번에 빌드
+  - 원본만 바뀌었으면 그 파일만, 스펙이 바뀌었으면 전체를 증분 빌드
+  - 프로세스를 계속 살려 두므로 폰트/프레임 템플릿 LRU 와 워커 풀이 데워진 채로 유지
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import pipeline
+from .spec import SpecError, graphic_entries, resolve_path
+
+# 마지막 변경 후 이 시간(초) 동안 조용하면 빌드
+DEBOUNCE_SECONDS = 0.3
+POLL_INTERVAL = 0.5
+
+# 편집 중인 스펙에서 날 수 있는 오류 (감시 루프는 죽지 않고 다음 변경을 기다림)
+SPEC_ERRORS = (SpecError, OSError, ValueError, KeyError, IndexError, TypeError)
+
+
+def watched_paths(spec):
+    """감시할 파일 경로 집합과 그 파일들이 있는 폴더 목록"""
+    files = {spec["_path"]}
+    shots = spec.get("screenshots")
+    input_dir = resolve_path(spec, shots["input_dir"]) if shots else None
+    if input_dir and os.path.isdir(input_dir):
+        files.update(os.path.join(input_dir, name) for name in os.listdir(input_dir))
+    files.update(entry.icon_path for entry in graphic_entries(spec) if entry.icon_path)
+    dirs = {os.path.dirname(path) for path in files}
+    if input_dir:
+        dirs.add(input_dir)  # 새로 추가되는 원본도 잡도록
+    return files, input_dir, sorted(d for d in dirs if os.path.isdir(d))
+
+
+def _snapshot(spec):
+    files, input_dir, _ = watched_paths(spec)
+    state = {}
+    for path in files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        state[path] = (st.st_size, st.st_mtime_ns)
+    return state
+
+
+def _load_or_report(load):
+    """스펙을 읽고 감시 대상까지 확인해서 (spec, snapshot) 반환 (오류면 출력 후 (None, None))"""
+    try:
+        spec = load()
+        return spec, _snapshot(spec)
+    except SPEC_ERRORS as e:
+        print(f"❌ 스펙 오류: {e} (고칠 때까지 계속 감시합니다)")
+        return None, None
+
+
+async def _poll_changes(load, queue, interval):
+    spec, previous = _load_or_report(load)
+    # 시작할 때 스펙이 깨져 있었으면 빈 상태에서 출발 → 고쳐지는 순간 전체 빌드
+    previous = previous or {}
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            spec = load()
+        except SPEC_ERRORS:
+            if spec is None:
+                continue
+            # 스펙 편집 중 (빌드할 때 오류를 보여줌), 마지막으로 읽힌 스펙의 파일 목록으로 감시
+        try:
+            current = _snapshot(spec)
+        except SPEC_ERRORS:
+            # 읽히기는 하지만 항목이 잘못된 스펙: 스펙 파일 자체 변경만 잡고 나머지는 이전 상태 유지
+            current = dict(previous)
+            path = spec["_path"]
+            try:
+                st = os.stat(path)
+                current[path] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass
+        changed = {path for path in previous.keys() | current.keys()
+                   if previous.get(path) != current.get(path)}
+        previous = current
+        if changed:
+            await queue.put(changed)
+
+
+async def _notify_changes(load, queue, watchfiles):
+    spec, _ = _load_or_report(load)
+    if spec is None:
+        # 감시할 폴더를 알 수 없으므로 이번 실행은 폴링으로 감시
+        await _poll_changes(load, queue, POLL_INTERVAL)
+        return
+    files, input_dir, dirs = watched_paths(spec)
+
+    def relevant(change, path):
+        # 출력 폴더가 감시 폴더 안에 있어도 결과 파일 저장으로 다시 빌드되지 않게 거름
+        return path in files or (input_dir is not None and os.path.dirname(path) == input_dir)
+
+    async for changes in watchfiles.awatch(*dirs, watch_filter=relevant, recursive=False,
+                                           debounce=int(DEBOUNCE_SECONDS * 1000)):
+        await queue.put({path for _, path in changes})
+
+
+async def _debounced(queue, delay):
+    """첫 변경을 기다린 뒤 delay 초 동안 추가 변경이 없을 때까지 모음"""
+    changed = set(await queue.get())
+    while True:
+        try:
+            changed |= await asyncio.wait_for(queue.get(), delay)
+        except asyncio.TimeoutError:
+            return changed
+
+
+def _changed_items(spec, changed):
+    """바뀐 원본 스크린샷 파일명 목록 (스펙/아이콘이 바뀌었으면 None = 전체)"""
+    shots = spec.get("screenshots")
+    if spec["_path"] in changed or not shots:
+        return None
+    input_dir = resolve_path(spec, shots["input_dir"])
+    if any(os.path.dirname(path) != input_dir for path in changed):
+        return None
+    names = {item["file"] for item in shots.get("items", [])}
+    changed_names = sorted(os.path.basename(path) for path in changed)
+    skipped = [name for name in changed_names if name not in names]
+    if skipped:
+        print(f"⚠️  스펙에 없는 원본이라 건너뜀: {', '.join(skipped)}")
+    return [name for name in changed_names if name in names]
+
+
+def _build(load, changed, only, kinds, locales, options):
+    """변경분 빌드 (asyncio 이벤트 루프 밖의 스레드에서 실행)"""
+    started = time.perf_counter()
+    try:
+        spec = load()
+        targets = only
+        if changed is not None:
+            items = _changed_items(spec, changed)
+            if items is not None:
+                if not items:
+                    return
+                targets = [name for name in items if not only or name in only]
+                if not targets:
+                    return
+        pipeline.run(spec, only=targets, kinds=kinds, locales=locales, **options)
+    except SPEC_ERRORS as e:
+        print(f"❌ 스펙 오류: {e}")
+        return
+    except Exception as e:
+        # 감시 루프는 계속 살아 있어야 하므로 빌드 실패는 출력만
+        print(f"❌ 빌드 실패: {type(e).__name__}: {e}")
+        return
+    print(f"⏱️  {time.perf_counter() - started:.2f}초")
+
+
+async def _watch(load, only, kinds, locales, poll, options):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    watchfiles = None
+    if not poll:
+        try:
+            import watchfiles
+        except ImportError:
+            print("ℹ️  watchfiles 가 없어 폴링으로 감시합니다 (pip install watchfiles)")
+    if watchfiles is not None:
+        watcher = _notify_changes(load, queue, watchfiles)
+    else:
+        watcher = _poll_changes(load, queue, POLL_INTERVAL)
+    task = asyncio.create_task(watcher)
+
+    # 처음 한 번 전체 증분 빌드 (폰트/템플릿/워커도 이때 데워짐)
+    await loop.run_in_executor(None, _build, load, None, only, kinds, locales, options)
+    options = dict(options, force=False)
+    print("👀 변경 감시 중... (Ctrl+C 로 종료)")
+    try:
+        while True:
+            changed = await _debounced(queue, DEBOUNCE_SECONDS)
+            names = ", ".join(sorted(os.path.basename(path) for path in changed))
+            print(f"\n🔄 변경 감지: {names}")
+            await loop.run_in_executor(None, _build, load, changed, only, kinds, locales, options)
+    finally:
+        task.cancel()
+
+
+def watch(load, only=None, kinds=pipeline.KINDS, locales=None, poll=False, jobs=1, **options):
+    """변경 감시 루프 실행 (Ctrl+C 로 끝나면 0 반환)
+
+    load: 스펙을 새로 읽는 함수, 나머지 키워드는 pipeline.run() 옵션
+    """
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    options = dict(options, jobs=jobs, executor=executor)
+    try:
+        asyncio.run(_watch(load, only, kinds, locales, poll, options))
+    except KeyboardInterrupt:
+        print("\n👋 감시 종료")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return 0
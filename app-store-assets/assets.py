@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+app-store-assets 통합 CLI
+
+  python3 assets.py build [--only NAME ...]     # 전체 빌드 (build_assets.py)
+  python3 assets.py frame [--preview] ...       # 스크린샷 프레임 (screenshots/add_marketing_text.py)
+  python3 assets.py first-frame                 # 1번 스크린샷만 (screenshots/update_first_screenshot.py)
+  python3 assets.py feature-graphic             # Feature Graphic (create_feature_graphic.py)
+  python3 assets.py simple-feature-graphic      # 아이콘 Feature Graphic (create_simple_feature_graphic.py)
+  python3 assets.py palette [PATH | --all]      # 대표 색상 (extract_icon_color.py)
+  python3 assets.py bench [-o bench.json]       # 벤치마크 (benchmark.py)
+  python3 assets.py regress [--update]          # 골든 이미지 회귀 검사 (check_regressions.py)
+  python3 assets.py daemon [--stop | --status]  # 렌더 데몬
+
+하위 명령의 옵션은 원래 스크립트와 같다 (python3 assets.py build --help).
+각 명령 모듈(Pillow, NumPy, 폰트)은 그 명령을 실행할 때 처음 import 한다.
+
+python3 assets.py daemon 을 띄워 두면 다른 명령은 유닉스 소켓으로 데몬에 넘어가서
+데워진 프로세스(폰트, 프레임 템플릿, 팔레트 캐시)에서 실행된다. 데몬이 없으면
+(또는 --no-daemon, --watch) 이 프로세스에서 바로 실행한다.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+import sys
+
+from assetkit import daemon
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 하위 명령 → (모듈 이름 또는 스크립트 경로, 설명)
+COMMANDS = {
+    "build": ("build_assets", "스토어 에셋 전체 빌드"),
+    "frame": ("screenshots/add_marketing_text.py", "스크린샷에 마케팅 텍스트 프레임 추가"),
+    "first-frame": ("screenshots/update_first_screenshot.py", "1번 스크린샷만 다시 처리"),
+    "feature-graphic": ("create_feature_graphic", "Feature Graphic (1024x500) 생성"),
+    "simple-feature-graphic": ("create_simple_feature_graphic", "아이콘 중앙 배치 Feature Graphic 생성"),
+    "palette": ("extract_icon_color", "이미지 대표 색상/팔레트 추출"),
+    "bench": ("assetkit.bench", "렌더링 벤치마크"),
+    "regress": ("check_regressions", "출력 이미지를 골든 이미지와 비교"),
+}
+
+_loaded = {}
+
+
+def _load(command):
+    """하위 명령 모듈 (처음 부를 때 import)"""
+    if command not in _loaded:
+        target = COMMANDS[command][0]
+        if target.endswith(".py"):
+            name = os.path.splitext(os.path.basename(target))[0]
+            spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, target))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(target)
+        _loaded[command] = module
+    return _loaded[command]
+
+
+def dispatch(argv):
+    """[하위 명령, 인자...] 실행 후 종료 코드 반환"""
+    command, args = argv[0], argv[1:]
+    return _load(command).main(args) or 0
+
+
+def _warm():
+    """데몬 시작 시 명령 모듈과 기본 캡션 폰트 미리 로드"""
+    for command in COMMANDS:
+        _load(command)
+    from assetkit import fonts
+    from assetkit.screenshot import DEFAULT_CAPTION
+    for size in (DEFAULT_CAPTION.title_size, DEFAULT_CAPTION.subtitle_size):
+        fonts.korean_font(size, tuple(DEFAULT_CAPTION.font_indexes))
+
+
+def _daemon(argv):
+    parser = argparse.ArgumentParser(prog="assets.py daemon", description="렌더 데몬 실행/관리")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--stop", action="store_true", help="실행 중인 데몬 종료")
+    group.add_argument("--status", action="store_true", help="데몬 실행 여부 확인")
+    args = parser.parse_args(argv)
+
+    if args.stop:
+        print("👋 데몬 종료" if daemon.stop() else "ℹ️  실행 중인 데몬이 없습니다")
+        return 0
+    if args.status:
+        info = daemon.status()
+        if info is None:
+            print("ℹ️  실행 중인 데몬이 없습니다")
+            return 1
+        print(f"🔥 데몬 실행 중 (pid {info['pid']}, {info['uptime']}초, 요청 {info['requests']}개)")
+        return 0
+    return daemon.serve(dispatch, warm=_warm)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="app-store-assets 통합 CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(f"  {name:<24}{help}" for name, (_, help) in COMMANDS.items())
+        + "\n  daemon                  렌더 데몬 실행 (--stop, --status)")
+    parser.add_argument("--no-daemon", action="store_true", help="데몬이 떠 있어도 이 프로세스에서 실행")
+    parser.add_argument("command", choices=list(COMMANDS) + ["daemon"], metavar="COMMAND")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="하위 명령 옵션")
+    args = parser.parse_args(argv)
+
+    if args.command == "daemon":
+        return _daemon(args.args)
+    argv = [args.command] + args.args
+    if not args.no_daemon and "--watch" not in args.args:
+        code = daemon.request(argv)
+        if code is not None:
+            return code
+    return dispatch(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
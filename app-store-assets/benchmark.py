@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+app-store-assets 렌더링 벤치마크
+
+합성 스크린샷(실제 기기 해상도)으로 프레임 합성/캡션/인코딩, Feature Graphic,
+대표 색상 추출을 단계별로 측정한다. 자세한 옵션은 --help 참고.
+
+  python3 benchmark.py -o bench.json                 # 결과 저장
+  python3 benchmark.py --baseline bench.json          # 기준과 비교
+"""
+
+import sys
+
+from assetkit import bench
+
+if __name__ == "__main__":
+    sys.exit(bench.main())
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+assets.json 스펙에 정의된 스토어 에셋(스크린샷 + Feature Graphic) 전체 빌드
+
+바뀐 입력이 있는 출력만 다시 만들고, 전체를 하나의 배치 작업으로 돌린다.
+--export 를 주면 스토어 규격 크기(Play Store, App Store 6.7"/6.5"/5.5")와 랜딩 페이지용
+WebP 변형도 렌더링 결과 1장에서 축소해 만든다. (--report-bytes 로 절약된 바이트 확인)
+"""
+
+import argparse
+import sys
+
+from assetkit import pipeline
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스토어 에셋 전체 빌드")
+    pipeline.add_arguments(parser)
+    parser.add_argument("--only", nargs="+", default=None, metavar="NAME",
+                        help="이 항목만 빌드 (스크린샷 파일명 또는 feature graphic 이름)")
+    parser.add_argument("--locale", nargs="+", default=None, dest="locales",
+                        help="이 로케일만 빌드 (기본값: 스펙의 locales)")
+    args = parser.parse_args(argv)
+    return pipeline.run_from_args(args, only=args.only, locales=args.locales)
+
+if __name__ == "__main__":
+    sys.exit(main())
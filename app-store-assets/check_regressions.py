@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+assets.json 출력물 회귀 검사
+
+스펙의 출력 파일(스크린샷, Feature Graphic)을 golden/ 아래 같은 상대 경로의 골든
+이미지와 비교한다. 달라진 이미지는 heatmap 과 summary.json 을 --report 폴더에 남긴다.
+
+  python3 check_regressions.py --update        # 현재 출력을 골든으로 저장
+  python3 build_assets.py && python3 check_regressions.py
+"""
+
+import argparse
+import os
+import sys
+
+from assetkit import regress
+from assetkit.spec import SpecError, graphic_entries, load_spec, screenshot_entries
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+STATUS_ICONS = {
+    "identical": "✅",
+    "within_tolerance": "✅",
+    "changed": "❌",
+    "size_mismatch": "❌",
+    "missing_golden": "⚠️ ",
+    "missing_output": "⚠️ ",
+}
+
+def spec_pairs(spec, golden_dir, export=False):
+    """[(이름, 출력 경로, 골든 경로)] (이름은 스펙 폴더 기준 상대 경로)"""
+    outputs = []
+    for entry in screenshot_entries(spec) + graphic_entries(spec):
+        outputs.extend(entry.outputs + (entry.exports if export else []))
+    pairs = []
+    for output in outputs:
+        name = os.path.relpath(output.path, spec["_base_dir"])
+        pairs.append((name, output.path, os.path.join(golden_dir, name)))
+    return pairs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="출력 이미지를 골든 이미지와 비교")
+    parser.add_argument("--spec", default=None, help="빌드 스펙 파일 (기본값: app-store-assets/assets.json)")
+    parser.add_argument("--golden", default=GOLDEN_DIR, help="골든 이미지 폴더")
+    parser.add_argument("--report", default=regress.DEFAULT_REPORT_DIR, help="heatmap/summary.json 저장 폴더")
+    parser.add_argument("--tolerance", type=int, default=regress.DEFAULT_TOLERANCE,
+                        help="픽셀 채널 차이 허용값 (0-255)")
+    parser.add_argument("--max-changed", type=float, default=regress.DEFAULT_MAX_CHANGED,
+                        help="통과로 보는 변경 픽셀 비율")
+    parser.add_argument("--export", action="store_true", help="스펙의 exports 출력도 검사")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="비교 스레드 수")
+    parser.add_argument("--update", action="store_true", help="현재 출력을 골든 이미지로 저장")
+    args = parser.parse_args(argv)
+
+    try:
+        pairs = spec_pairs(load_spec(args.spec), os.path.abspath(args.golden), args.export)
+    except (SpecError, OSError) as e:
+        print(f"❌ 스펙 오류: {e}")
+        return 2
+
+    if args.update:
+        regress.update_golden(pairs)
+        print(f"📸 골든 이미지 {len(pairs)}개 저장: {args.golden}")
+        return 0
+
+    results = regress.check(pairs, args.report, args.tolerance, args.max_changed, args.jobs)
+    for result in results:
+        detail = ""
+        if result.status in ("changed", "within_tolerance"):
+            detail = (f" (변경 픽셀 {result.changed_pixels} · {result.changed_ratio:.4%} · "
+                      f"최대 차이 {result.max_diff} · 변경 타일 {result.changed_tiles})")
+        print(f"{STATUS_ICONS[result.status]} {result.name}: {result.status}{detail}")
+        if result.heatmap:
+            print(f"   🔥 {result.heatmap}")
+
+    failures = [result for result in results if regress.is_failure(result)]
+    print(f"\n📋 {len(results)}개 중 실패 {len(failures)}개 · 요약: {os.path.join(args.report, 'summary.json')}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,43 @@
 #!/usr/bin/env python3
 """
 아이콘에서 정확한 배경색 추출
+
+--all 을 주면 에셋 폴더 전체(아이콘, 원본/결과 스크린샷)를 스레드 풀로 분석하고
+결과를 .build-cache/palettes.json 에 파일 해시별로 저장한다. 생성 스크립트는 이
+캐시를 조회하므로 assets.json 에서 배경색을 "auto" 로 두면 직접 붙여 넣을 필요가 없다.
+기본 아이콘과 --all 의 아이콘은 assets.json 의 icon Feature Graphic 에서 가져온다.
+분석에 실패한 이미지가 있으면 종료 코드 1.
 """
 
-from PIL import Image
-import collections
+import argparse
+import os
+import sys
 
-def extract_dominant_color():
-    """아이콘에서 가장 많이 사용된 색상 추출"""
-    
-    icon_path = "/Users/elanvital3/Projects/2025_honbab-nono/flutter-app/assets/images/icon.png"
+from assetkit import ASSETS_DIR, palettes
+from assetkit.colors import dominant_colors, kmeans_palette, open_image
+from assetkit.spec import SpecError, icon_paths, load_spec
+
+# 스펙에 아이콘이 없을 때 쓰는 앱 아이콘 (저장소 기준 상대 경로)
+ICON_PATH = os.path.normpath(os.path.join(ASSETS_DIR, "..", "flutter-app", "assets", "images", "icon.png"))
+
+def default_icon_path(spec_path=None):
+    """assets.json 의 첫 번째 icon Feature Graphic 아이콘 (없거나 스펙을 못 읽으면 ICON_PATH)"""
+    try:
+        icons = icon_paths(load_spec(spec_path))
+    except (OSError, SpecError, ValueError):
+        icons = []
+    return icons[0] if icons else ICON_PATH
+
+def extract_dominant_color(icon_path=ICON_PATH, top=5, bits=8, max_pixels=None, min_alpha=None):
+    """아이콘에서 가장 많이 사용된 색상 추출 (실패하면 None)"""
     
     try:
         # 아이콘 열기
-        icon = Image.open(icon_path)
-        
-        # RGB 모드로 변환
-        if icon.mode != 'RGB':
-            icon = icon.convert('RGB')
-        
-        # 색상 데이터 가져오기
-        colors = icon.getdata()
+        icon = open_image(icon_path)
         
-        # 색상별 빈도 계산
-        color_counts = collections.Counter(colors)
-        
-        # 가장 많이 사용된 색상 5개
-        most_common = color_counts.most_common(5)
+        # 색상별 빈도 계산 (NumPy 벡터 연산, 많이 사용된 순)
+        most_common = dominant_colors(icon, top=top, bits=bits,
+                                      max_pixels=max_pixels, min_alpha=min_alpha)
         
         print("🎨 아이콘에서 가장 많이 사용된 색상들:")
         for i, (color, count) in enumerate(most_common):
@@ -40,7 +51,58 @@ def extract_dominant_color():
         
     except Exception as e:
         print(f"❌ 에러: {e}")
-        return (210, 180, 140)  # 기본값
+        return None
+
+def print_palette(icon_path=ICON_PATH, k=5, min_alpha=None):
+    """k-means 방식 대표 팔레트 출력"""
+    palette = kmeans_palette(open_image(icon_path), k=k, min_alpha=min_alpha)
+    print(f"\n🎨 대표 팔레트 ({len(palette)}색):")
+    for color, share in palette:
+        print(f"   RGB{color} - {share:.1%}")
+    return palette
+
+def analyze_assets(roots=None, jobs=None):
+    """에셋 이미지 일괄 분석 결과 출력 (바뀌지 않은 파일은 캐시 사용)"""
+    paths = palettes.asset_images(roots)
+    cache = palettes.PaletteCache()
+    results = palettes.analyze_all(paths, jobs, cache)
+
+    print(f"🎨 이미지 {len(paths)}개 분석 (캐시 적중 {cache.hits} · 새로 분석 {cache.misses})")
+    for path, result in results.items():
+        name = os.path.relpath(path)
+        if isinstance(result, Exception):
+            print(f"❌ {name}: {result}")
+            continue
+        palette = " ".join(f"RGB{tuple(color)}" for color, _ in result["palette"][:3])
+        print(f"   {name}: 대표 RGB{tuple(result['dominant'] or ())} · 팔레트 {palette}")
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="이미지에서 대표 색상 추출")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="분석할 이미지 (기본값: assets.json 의 앱 아이콘)")
+    parser.add_argument("--spec", default=None, help="아이콘/분석 대상을 읽을 스펙 (기본값: assets.json)")
+    parser.add_argument("--top", type=int, default=5, help="출력할 색상 수")
+    parser.add_argument("--bits", type=int, default=8, choices=range(1, 9),
+                        help="채널별 양자화 비트 수 (8이면 원본 색)")
+    parser.add_argument("--max-pixels", type=int, default=None, help="이보다 크면 격자 샘플링")
+    parser.add_argument("--min-alpha", type=int, default=None, help="이 알파 미만 픽셀 제외")
+    parser.add_argument("--palette", type=int, default=0, metavar="K", help="k-means 팔레트 K색 추가 출력")
+    parser.add_argument("--all", nargs="*", default=None, metavar="ROOT",
+                        help="폴더 전체 일괄 분석 (기본값: app-store-assets + 스펙의 아이콘)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="--all 분석 스레드 수")
+    args = parser.parse_args(argv)
+
+    if args.all is not None:
+        results = analyze_assets(args.all or palettes.default_roots(args.spec), args.jobs)
+        return 1 if any(isinstance(result, Exception) for result in results.values()) else 0
+
+    path = args.path or default_icon_path(args.spec)
+    if extract_dominant_color(path, args.top, args.bits, args.max_pixels, args.min_alpha) is None:
+        return 1
+    if args.palette:
+        print_palette(path, args.palette, args.min_alpha)
+    return 0
 
 if __name__ == "__main__":
-    extract_dominant_color()
\ No newline at end of file
+    sys.exit(main())
@@ -1,213 +1,76 @@
 #!/usr/bin/env python3
 """
 Google Play Store 스타일 앱 스크린샷에 마케팅 텍스트 추가 스크립트
+
+캡션 문구, 폰트 크기, 프레임 지오메트리, 출력 포맷은 ../assets.json 스펙에 있고
+실제 렌더링은 assetkit 파이프라인이 한다.
+
+로케일을 여러 개 주면 (스펙의 "locales" 또는 --locale ko en ja) 원본마다 한 번만
+디코드·프레임 합성하고, 로케일별 캡션을 그 사본에 찍어 바로 저장한다.
+기본 로케일이 아닌 결과는 output_dir/<locale>/ 에 저장된다.
+
+캡션 문구를 다듬는 중에는 --preview (또는 --preview 8) 로 1/4 (1/8) 크기 시안을
+빠르게 만들 수 있다. 결과는 출력 폴더의 preview/ 에 저장된다.
+
+느린 구간을 찾을 때는 --profile timings.jsonl (단계별 wall/CPU 시간, 크기, 바이트 수)
+과 --cprofile run.prof (cProfile 통계) 를 쓴다.
+
+--watch 를 주면 원본 폴더와 스펙을 감시하면서 새 캡처를 넣거나 캡션을 고칠 때마다
+바뀐 스크린샷만 다시 만든다.
+
+기기 크기·로케일이 많아 -j 로 여러 프로세스를 돌릴 때는 --shared-memory 를 주면 원본을
+이 프로세스에서 한 번 디코드해 공유 메모리로 워커에 넘긴다 (pickle 복사 없음).
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
+import argparse
 import os
 import sys
 
-# 스크린샷 정보와 텍스트 정의
-SCREENSHOTS = {
-    "01_home_restaurant_list.jpeg": {
-        "title": "여행지 맛집을 한눈에 발견하세요",
-        "subtitle": "구글 평점과 유튜브 추천 맛집을 모두 확인할 수 있어요"
-    },
-    "02_restaurant_detail.jpeg": {
-        "title": "맛집 정보를 한 번에 확인하세요",
-        "subtitle": "구글 리뷰부터 네이버 블로그까지 모든 정보를 한곳에서"
-    },
-    "03_create_meeting.jpeg": {
-        "title": "원하는 조건으로 모임을 만들어보세요",
-        "subtitle": "성별과 인원수를 설정하고 맛집 모임을 주최할 수 있어요"
-    },
-    "04_map_view.jpeg": {
-        "title": "지도에서 주변 모임을 찾아보세요",
-        "subtitle": "실시간으로 진행되는 맛집 모임을 지도에서 한눈에 확인"
-    },
-    "05_meeting_list.jpeg": {
-        "title": "내 주변 맛집 모임을 둘러보세요",
-        "subtitle": "관심있는 모임을 찾아 바로 참여 신청할 수 있어요"
-    },
-    "06_meeting_detail.jpeg": {
-        "title": "모임 신청 후 승인을 기다려보세요",
-        "subtitle": "호스트가 승인하면 바로 모임 참석자가 될 수 있어요"
-    },
-    "07_chat_conversation.jpeg": {
-        "title": "만나기 전에 미리 인사해보세요",
-        "subtitle": "간단한 자기소개와 대화로 어색함을 줄일 수 있어요"
-    }
-}
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from assetkit import pipeline, profiling
+from assetkit.screenshot import render_screenshot
+from assetkit.spec import caption_style, frame_style, load_spec
+
+def add_text_to_image(image_path, output_path, title, subtitle, disk_frame_cache=False, spec=None):
+    """Google Play Store 스타일 프레임에 텍스트 오버레이 추가 (스펙 기본 스타일, JPEG)
+
+    spec 을 주지 않으면 그때 assets.json 을 읽는다 (import 할 때는 스펙을 읽지 않음).
+    실패 시 예외를 그대로 올린다. profiling.image() 블록 안에서 호출하면
+    decode ~ encode 단계별 시간이 그 레코드에 쌓인다.
+    """
+    spec = spec or load_spec()
+    with Image.open(image_path) as img:
+        with profiling.stage("decode"):
+            img.load()
+        frame = render_screenshot(img, title, subtitle, frame_style(spec),
+                                  caption_style(spec), disk_frame_cache)
+    with profiling.stage("encode"):
+        frame.save(output_path, 'JPEG', quality=95)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="스크린샷에 마케팅 텍스트 프레임 추가")
+    pipeline.add_arguments(parser)
+    pipeline.add_preview_argument(parser)
+    parser.add_argument("--input-dir", default=None, help="원본 스크린샷 폴더 (스펙 값 대신 사용)")
+    parser.add_argument("--output-dir", default=None, help="결과 저장 폴더 (스펙 값 대신 사용)")
+    parser.add_argument("--locale", nargs="+", default=None, dest="locales",
+                        help="렌더링할 로케일 (기본값: 스펙의 locales)")
+    return parser.parse_args(argv)
 
-def add_text_to_image(image_path, output_path, title, subtitle):
-    """Google Play Store 스타일 프레임에 텍스트 오버레이 추가"""
-    try:
-        # 이미지 열기
-        img = Image.open(image_path)
-        
-        # 이미지 크기 가져오기
-        width, height = img.size
-        
-        # 프레임 크기 설정 (Google Play Store 스타일)
-        frame_width = width + 200  # 좌우 여백
-        frame_height = height + 300  # 상하 여백 (텍스트 영역 포함)
-        
-        # 혼밥노노 브랜드 컬러
-        brand_beige = (210, 180, 140)  # #D2B48C
-        brand_beige_light = (240, 220, 190)  # 연한 베이지
-        text_dark = (80, 60, 40)  # 어두운 브라운
-        text_white = (255, 255, 255)  # 흰색
-        
-        # 새로운 프레임 캔버스 생성
-        frame = Image.new('RGB', (frame_width, frame_height), brand_beige_light)
-        
-        # 스마트폰 프레임 그리기
-        phone_x = 100
-        phone_y = 230
-        phone_width = width
-        phone_height = height
-        
-        # 스마트폰 배경 (그림자 효과)
-        shadow_offset = 8
-        shadow_color = (0, 0, 0, 50)
-        shadow_frame = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow_frame)
-        shadow_draw.rounded_rectangle(
-            [phone_x + shadow_offset, phone_y + shadow_offset, 
-             phone_x + phone_width + shadow_offset, phone_y + phone_height + shadow_offset], 
-            radius=30, fill=shadow_color
-        )
-        
-        # 스마트폰 프레임 (둥근 모서리)
-        phone_frame = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-        phone_draw = ImageDraw.Draw(phone_frame)
-        phone_draw.rounded_rectangle(
-            [phone_x, phone_y, phone_x + phone_width, phone_y + phone_height], 
-            radius=30, fill=(40, 40, 40)
-        )
-        
-        # 스마트폰 스크린 영역 (내부 패딩)
-        screen_padding = 8
-        screen_x = phone_x + screen_padding
-        screen_y = phone_y + screen_padding
-        screen_width = phone_width - (screen_padding * 2)
-        screen_height = phone_height - (screen_padding * 2)
-        
-        # 레이어 합성
-        frame = Image.alpha_composite(frame.convert('RGBA'), shadow_frame)
-        frame = Image.alpha_composite(frame, phone_frame)
-        
-        # 스크린샷 이미지 크기 조정 및 삽입
-        screen_img = img.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-        screen_mask = Image.new('L', (screen_width, screen_height), 0)
-        screen_mask_draw = ImageDraw.Draw(screen_mask)
-        screen_mask_draw.rounded_rectangle([0, 0, screen_width, screen_height], radius=22, fill=255)
-        
-        frame.paste(screen_img, (screen_x, screen_y), screen_mask)
-        
-        # 텍스트 추가
-        draw = ImageDraw.Draw(frame)
-        
-        # 한국어 폰트 설정 (1번과 동일하게 적용)
-        try:
-            # AppleSDGothicNeo SemiBold (중간 두께)
-            title_font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", 64, index=5)  # SemiBold
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", 42, index=5)  # SemiBold
-        except:
-            try:
-                # Bold 시도
-                title_font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", 64, index=6)  # Bold
-                subtitle_font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", 42, index=6)  # Bold
-            except:
-                title_font = ImageFont.load_default()
-                subtitle_font = ImageFont.load_default()
-        
-        # 텍스트 영역 (상단에 모든 텍스트 배치)
-        text_start_y = 55
-        
-        # 제목 텍스트 (첫 번째 줄)
-        title_bbox = draw.textbbox((0, 0), title, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_x = max(20, (frame_width - title_width) // 2)  # 최소 여백 20px
-        title_y = text_start_y
-        
-        # 제목이 너무 길면 자동으로 줄바꿈
-        if title_width > frame_width - 40:  # 좌우 여백 20px씩
-            words = title.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + word + " "
-                test_bbox = draw.textbbox((0, 0), test_line, font=title_font)
-                test_width = test_bbox[2] - test_bbox[0]
-                
-                if test_width <= frame_width - 40:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                        current_line = word + " "
-                    else:
-                        lines.append(word)
-            
-            if current_line:
-                lines.append(current_line.strip())
-            
-            # 여러 줄 제목 그리기
-            for i, line in enumerate(lines):
-                line_bbox = draw.textbbox((0, 0), line, font=title_font)
-                line_width = line_bbox[2] - line_bbox[0]
-                line_x = (frame_width - line_width) // 2
-                line_y = text_start_y + (i * 72)
-                draw.text((line_x, line_y), line, font=title_font, fill=text_dark)
-            
-            subtitle_y_start = text_start_y + len(lines) * 72 + 30
-        else:
-            # 한 줄 제목 그리기
-            draw.text((title_x, title_y), title, font=title_font, fill=text_dark)
-            subtitle_y_start = text_start_y + 72 + 30
-        
-        # 부제목 텍스트 (제목 바로 아래)
-        subtitle_lines = subtitle.split('\n')
-        for i, line in enumerate(subtitle_lines):
-            line_bbox = draw.textbbox((0, 0), line, font=subtitle_font)
-            line_width = line_bbox[2] - line_bbox[0]
-            line_x = max(20, (frame_width - line_width) // 2)  # 최소 여백 20px
-            line_y = subtitle_y_start + (i * 52)
-            draw.text((line_x, line_y), line, font=subtitle_font, fill=text_dark)
-        
-        # 브랜드 로고/이름 제거 (요청사항)
-        
-        # 이미지 저장
-        frame.convert('RGB').save(output_path, 'JPEG', quality=95)
-        print(f"✅ 프레임 처리 완료: {output_path}")
-        
-    except Exception as e:
-        print(f"❌ 에러 발생 ({image_path}): {e}")
+def load_script_spec(args):
+    """스펙을 읽고 --input-dir/--output-dir 를 반영 (--watch 에서는 변경마다 다시 호출)"""
+    spec = load_spec(args.spec)
+    if args.input_dir:
+        spec["screenshots"]["input_dir"] = os.path.abspath(args.input_dir)
+    if args.output_dir:
+        spec["screenshots"]["output_dir"] = os.path.abspath(args.output_dir)
+    return spec
 
-def main():
-    # 입력 및 출력 폴더 경로
-    input_dir = "/Users/elanvital3/Projects/2025_honbab-nono/app-store-assets/screenshots/original"
-    output_dir = "/Users/elanvital3/Projects/2025_honbab-nono/app-store-assets/screenshots/processed"
-    
-    # 출력 폴더 생성
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # 각 스크린샷 처리
-    for filename, text_info in SCREENSHOTS.items():
-        input_path = os.path.join(input_dir, filename)
-        output_path = os.path.join(output_dir, filename)
-        
-        if os.path.exists(input_path):
-            add_text_to_image(
-                input_path, 
-                output_path, 
-                text_info["title"], 
-                text_info["subtitle"]
-            )
-        else:
-            print(f"❌ 파일을 찾을 수 없습니다: {input_path}")
+def main(argv=None):
+    args = parse_args(argv)
+    return pipeline.run_from_args(args, lambda: load_script_spec(args),
+                                  kinds=("screenshot",), locales=args.locales)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+스모크 테스트 공용 fixture
+
+스크립트를 실제로 실행하되, 빌드 캐시(.build-cache)와 데몬 소켓이 작업 트리의 것을
+건드리지 않도록 app-store-assets 를 임시 폴더에 복사해서 그 안에서 실행한다.
+(assetkit.CACHE_DIR 은 패키지 위치 기준이므로 복사본은 자기 캐시 폴더를 쓴다)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ORIGINAL_DIR = os.path.join(ASSETS_DIR, "screenshots", "original")
+
+# 스모크 빌드는 원본 2장 + 텍스트 feature graphic 1장만
+SCREENSHOT_COUNT = 2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """app-store-assets 복사본 (캐시/결과물/원본 이미지는 빼고 복사)"""
+    root = tmp_path / "app-store-assets"
+    shutil.copytree(ASSETS_DIR, root, ignore=shutil.ignore_patterns(
+        ".build-cache", "__pycache__", ".pytest_cache", "tests", "original", "processed", "*.png"))
+    return root
+
+
+@pytest.fixture
+def sample_spec(workspace, tmp_path):
+    """assets.json 을 줄여서 tmp_path/out 에 빌드하는 스펙 파일 경로"""
+    with open(os.path.join(ASSETS_DIR, "assets.json"), encoding="utf-8") as f:
+        spec = json.load(f)
+    out_dir = tmp_path / "out"
+    shots = spec["screenshots"]
+    shots["input_dir"] = ORIGINAL_DIR
+    shots["output_dir"] = str(out_dir)
+    shots["items"] = shots["items"][:SCREENSHOT_COUNT]
+    graphic = next(entry for entry in spec["feature_graphics"] if entry["type"] == "text")
+    graphic["outputs"] = [{"path": str(out_dir / "feature_graphic.png"), "format": "PNG"}]
+    spec["feature_graphics"] = [graphic]
+    spec["defaults"].pop("exports", None)
+
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec, ensure_ascii=False, indent=1), encoding="utf-8")
+    return path
+
+
+def run_script(workspace, *args, timeout=120):
+    """복사본에서 스크립트 실행 → CompletedProcess (stdout 에 stderr 포함)"""
+    return subprocess.run([sys.executable, *args], cwd=workspace, env=_env(), timeout=timeout,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+class Script:
+    """백그라운드로 띄운 스크립트 (출력을 스레드로 모으며 원하는 줄을 기다림)"""
+
+    def __init__(self, workspace, *args):
+        self.process = subprocess.Popen([sys.executable, *args], cwd=workspace, env=_env(),
+                                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        self.lines = []
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.append(line)
+
+    @property
+    def output(self):
+        return "".join(self.lines)
+
+    def wait_for(self, text, count=1, timeout=60):
+        """출력에 text 가 count 번 나올 때까지 대기 (프로세스가 먼저 끝나거나 시간 초과면 실패)"""
+        deadline = time.monotonic() + timeout
+        while self.output.count(text) < count:
+            if self.process.poll() is not None:
+                self._reader.join(timeout=5)
+                if self.output.count(text) >= count:
+                    return
+                pytest.fail(f"{text!r} 전에 종료됨 (code {self.process.returncode}):\n{self.output}")
+            if time.monotonic() > deadline:
+                pytest.fail(f"{text!r} 대기 시간 초과:\n{self.output}")
+            time.sleep(0.1)
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self._reader.join(timeout=5)
+
+
+def _env():
+    # 출력을 바로바로 읽을 수 있게 버퍼링 끔
+    return dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
@@ -0,0 +1,125 @@
+"""
+스모크 테스트: 빌드 캐시, 벤치마크 결과 저장, watch, 데몬을 실제 스크립트로 한 번씩 실행
+
+  python -m pytest -q        (app-store-assets 에서)
+"""
+
+import json
+import os
+import re
+import signal
+
+from conftest import SCREENSHOT_COUNT, Script, run_script
+
+# 스크린샷 2장 + feature graphic 1장
+OUTPUT_COUNT = SCREENSHOT_COUNT + 1
+
+
+def _cache_counts(output):
+    """빌드 요약 줄의 (적중, 미적중)"""
+    match = re.search(r"📦 빌드 캐시: 적중 (\d+) · 미적중 (\d+)", output)
+    assert match, output
+    return int(match.group(1)), int(match.group(2))
+
+
+def test_build_cache_miss_then_hit(workspace, sample_spec, tmp_path):
+    first = run_script(workspace, "build_assets.py", "--spec", str(sample_spec))
+    assert first.returncode == 0, first.stdout
+    assert _cache_counts(first.stdout) == (0, OUTPUT_COUNT)
+    outputs = sorted(os.listdir(tmp_path / "out"))
+    assert len(outputs) == OUTPUT_COUNT
+    assert os.path.isfile(workspace / ".build-cache" / "manifest.json")
+
+    second = run_script(workspace, "build_assets.py", "--spec", str(sample_spec))
+    assert second.returncode == 0, second.stdout
+    assert _cache_counts(second.stdout) == (OUTPUT_COUNT, 0)
+    assert "✅ 생성 완료" not in second.stdout
+
+    # 캡션만 바꾸면 그 출력 하나만 다시 생성
+    spec = json.loads(sample_spec.read_text(encoding="utf-8"))
+    spec["screenshots"]["items"][0]["captions"]["ko"]["title"] = "스모크 테스트"
+    sample_spec.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+    third = run_script(workspace, "build_assets.py", "--spec", str(sample_spec))
+    assert third.returncode == 0, third.stdout
+    assert _cache_counts(third.stdout) == (OUTPUT_COUNT - 1, 1)
+    assert sorted(os.listdir(tmp_path / "out")) == outputs
+
+
+def test_build_reports_spec_error(workspace, tmp_path):
+    spec = tmp_path / "broken.json"
+    spec.write_text(json.dumps({"screenshots": {"items": [{"file": "a.jpeg"}]}}), encoding="utf-8")
+    result = run_script(workspace, "build_assets.py", "--spec", str(spec))
+    assert result.returncode == 2, result.stdout
+    assert "❌ 스펙 오류" in result.stdout
+    assert "Traceback" not in result.stdout
+
+
+def test_benchmark_writes_json(workspace, tmp_path):
+    out_dir = tmp_path / "bench"
+    out_dir.mkdir()
+    path = out_dir / "bench.json"
+    result = run_script(workspace, "benchmark.py", "--devices", "iphone_5_5", "--only", "resize:iphone",
+                        "--repeat", "1", "--no-isolate", "-o", str(path), timeout=300)
+    assert result.returncode == 0, result.stdout
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["meta"]["repeat"] == 1
+    assert list(data["cases"]) == ["resize:iphone_5_5"]
+    assert os.listdir(out_dir) == ["bench.json"]  # 임시 파일이 남지 않음
+
+
+def test_watch_survives_invalid_spec(workspace, sample_spec):
+    valid = sample_spec.read_text(encoding="utf-8")
+    sample_spec.write_text(valid[:len(valid) // 2], encoding="utf-8")  # 잘린 JSON
+
+    watcher = Script(workspace, "build_assets.py", "--spec", str(sample_spec), "--watch", "--poll")
+    try:
+        watcher.wait_for("❌ 스펙 오류")
+        watcher.wait_for("👀 변경 감시 중")
+
+        sample_spec.write_text(valid, encoding="utf-8")
+        watcher.wait_for("✅ 생성 완료", count=OUTPUT_COUNT)
+        watcher.wait_for("📦 빌드 캐시")
+
+        # 잘못된 항목이 들어와도 감시는 계속되고, 다시 고치면 바뀐 것만 빌드
+        spec = json.loads(valid)
+        spec["feature_graphics"][0]["type"] = "banner"
+        sample_spec.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+        watcher.wait_for("❌ 스펙 오류", count=2)
+        sample_spec.write_text(valid, encoding="utf-8")
+        watcher.wait_for("📦 빌드 캐시", count=2)
+
+        watcher.process.send_signal(signal.SIGINT)
+        assert watcher.process.wait(timeout=30) == 0
+        watcher.wait_for("👋 감시 종료")
+    finally:
+        watcher.close()
+    assert "Traceback" not in watcher.output
+
+
+def test_daemon_status(workspace, sample_spec):
+    status = run_script(workspace, "assets.py", "daemon", "--status")
+    assert status.returncode == 1
+    assert "실행 중인 데몬이 없습니다" in status.stdout
+
+    server = Script(workspace, "assets.py", "daemon")
+    try:
+        server.wait_for("🔥", timeout=120)
+        status = run_script(workspace, "assets.py", "daemon", "--status")
+        assert status.returncode == 0, status.stdout
+        assert f"pid {server.process.pid}" in status.stdout
+
+        # 다른 명령은 소켓으로 데몬에 넘어가서 실행됨
+        build = run_script(workspace, "assets.py", "build", "--spec", str(sample_spec))
+        assert build.returncode == 0, build.stdout
+        assert _cache_counts(build.stdout) == (0, OUTPUT_COUNT)
+        status = run_script(workspace, "assets.py", "daemon", "--status")
+        assert "요청 1개" in status.stdout
+
+        stop = run_script(workspace, "assets.py", "daemon", "--stop")
+        assert stop.returncode == 0 and "👋 데몬 종료" in stop.stdout
+        assert server.process.wait(timeout=30) == 0
+    finally:
+        server.close()
+
+    status = run_script(workspace, "assets.py", "daemon", "--status")
+    assert status.returncode == 1